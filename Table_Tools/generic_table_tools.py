@@ -1,8 +1,12 @@
+import copy
 import sys
+import time
+from collections import OrderedDict
 from http_layer import make_nws_request, NWS_API_BASE
 from utils import extract_keywords
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import re
+from urllib.parse import quote
 from contextlib import contextmanager
 from constants import (
     ESSENTIAL_FIELDS,
@@ -10,6 +14,8 @@ from constants import (
     NO_RECORDS_FOUND,
     RECORD_NOT_FOUND,
     NO_SIMILAR_RECORDS_FOUND,
+    MIN_SEARCH_TEXT_LENGTH,
+    SEARCH_TEXT_TOO_SHORT,
     CONNECTION_ERROR,
     NO_DESCRIPTION_FOUND,
     REQUEST_FAILED_ERROR,
@@ -37,6 +43,64 @@ from filter import (
 )
 
 
+# Text searches repeat when a caller retries or rephrases the same prompt;
+# keep an LRU of results, keyed by keyword set, so retries skip the round trip.
+# extract_keywords memoises its own work in utils.
+_TEXT_SEARCH_CACHE_SIZE = 256
+_TEXT_SEARCH_TTL_SECONDS = 30.0
+_text_search_cache: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+
+
+# sysparm_fields values per (table, detailed), joined once at import.
+_FIELDS_PARAMS = {
+    **{(table, False): ",".join(fields) for table, fields in ESSENTIAL_FIELDS.items()},
+    **{(table, True): ",".join(fields) for table, fields in DETAIL_FIELDS.items()},
+}
+_DEFAULT_FIELDS_PARAM = "number,short_description"
+
+
+# LRU of short_description by (table, record number). Descriptions rarely
+# change, and the write tools forget the entries they touch.
+_DESCRIPTION_CACHE_SIZE = 1024
+_DESCRIPTION_TTL_SECONDS = 300.0
+_description_cache: "OrderedDict[tuple[str, str], tuple[float, dict]]" = OrderedDict()
+
+
+def clear_query_caches() -> None:
+    """Drop cached text search results and record descriptions."""
+    _text_search_cache.clear()
+    _description_cache.clear()
+
+
+def forget_record_description(table_name: str, record_number: str) -> None:
+    """Drop the cached description for one record after it is written."""
+    _description_cache.pop((table_name, record_number), None)
+
+
+def _ttl_get(cache: OrderedDict, key: Any, ttl: float) -> Optional[dict]:
+    """Return a copy of a fresh cache entry and mark it most recently used.
+
+    Stale entries are dropped on the way out.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at >= ttl:
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return copy.deepcopy(value)
+
+
+def _ttl_put(cache: OrderedDict, key: Any, value: dict, max_size: int) -> None:
+    """Store a private copy of ``value``, evicting the least recently used entry."""
+    cache[key] = (time.monotonic(), copy.deepcopy(value))
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
 @contextmanager
 def timeout_protection(seconds=2):
     """Context manager to protect against long-running regex operations.
@@ -103,48 +167,80 @@ def _apply_sc_catalog_filter(table_name: str, existing_query: str = "") -> str:
 
 async def query_table_by_text(table_name: str, input_text: str, detailed: bool = False) -> dict[str, Any]:
     """Generic function to query any ServiceNow table by text similarity."""
-    fields = DETAIL_FIELDS[table_name] if detailed else ESSENTIAL_FIELDS[table_name]
+    # Degenerate input has no usable keywords; skip the extraction entirely
+    if not input_text or len(input_text.strip()) < MIN_SEARCH_TEXT_LENGTH:
+        return {"result": [], "message": SEARCH_TEXT_TOO_SHORT.format(min_length=MIN_SEARCH_TEXT_LENGTH)}
+
     keywords = extract_keywords(input_text)
+    # The OR query depends only on the keyword set, so paraphrases share an entry
+    cache_key = (table_name, tuple(sorted(keywords)), detailed)
+    cached = _ttl_get(_text_search_cache, cache_key, _TEXT_SEARCH_TTL_SECONDS)
+    if cached is not None:
+        return cached
+
+    result = await _query_table_by_keywords(table_name, keywords, detailed)
+    # Empty results may come from a failed request, so only hits are cached
+    if result["result"]:
+        _ttl_put(_text_search_cache, cache_key, result, _TEXT_SEARCH_CACHE_SIZE)
+    return result
 
-    for keyword in keywords:
-        query = f"short_descriptionCONTAINS{keyword}"
-        # Apply category filtering for incidents
-        query = _apply_incident_category_filter(table_name, query)
-        # Apply catalog filtering for service catalog tables
-        query = _apply_sc_catalog_filter(table_name, query)
-        base_url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={','.join(fields)}&sysparm_query={query}"
-        # Use pagination to limit results for text searches
-        all_results = await _make_paginated_request(base_url, max_results=50)  # Limit text searches to 50 results
+async def _query_table_by_keywords(table_name: str, keywords: Tuple[str, ...], detailed: bool) -> dict[str, Any]:
+    """Return records matching any keyword, fetched with one OR-joined query."""
+    if not keywords:
+        return {"result": [], "message": NO_RECORDS_FOUND}
 
-        if all_results:
-            result_count = len(all_results)
-            return {
-                "result": all_results,
-                "message": f"Found {result_count} records matching '{keyword}'" + (" (limited to 50)" if result_count == 50 else "")
-            }
+    fields_param = _FIELDS_PARAMS[(table_name, detailed)]
+    # ^OR binds tighter than ^, so the exclusion filters below apply to every keyword
+    query = "^OR".join(f"short_descriptionCONTAINS{keyword}" for keyword in keywords)
+    # Apply category filtering for incidents
+    query = _apply_incident_category_filter(table_name, query)
+    # Apply catalog filtering for service catalog tables
+    query = _apply_sc_catalog_filter(table_name, query)
+    base_url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={fields_param}&sysparm_query={query}"
+    # Use pagination to limit results for text searches
+    all_results = await _make_paginated_request(base_url, max_results=50)  # Limit text searches to 50 results
+
+    if all_results:
+        result_count = len(all_results)
+        matched = " or ".join(f"'{keyword}'" for keyword in keywords)
+        return {
+            "result": all_results,
+            "message": f"Found {result_count} records matching {matched}" + (" (limited to 50)" if result_count == 50 else "")
+        }
     # Return consistent dict format for no results
     return {"result": [], "message": NO_RECORDS_FOUND}
 
 async def get_record_description(table_name: str, record_number: str) -> dict[str, Any]:
     """Generic function to get short_description for any record."""
+    cache_key = (table_name, record_number)
+    cached = _ttl_get(_description_cache, cache_key, _DESCRIPTION_TTL_SECONDS)
+    if cached is not None:
+        return cached
+
     query = f"number={record_number}"
     # Apply category filtering for incidents
     query = _apply_incident_category_filter(table_name, query)
     # Apply catalog filtering for service catalog tables
     query = _apply_sc_catalog_filter(table_name, query)
-    url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields=short_description&sysparm_query={query}"
+    # Record numbers are unique, so one row is all the lookup needs
+    url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields=short_description&sysparm_query={query}&sysparm_limit=1"
     data = await make_nws_request(url)
-    return data if data else {"result": [], "message": RECORD_NOT_FOUND}
+    if not data:
+        return {"result": [], "message": RECORD_NOT_FOUND}
+    # Only found records are cached; a miss may be a record not created yet
+    if data.get("result"):
+        _ttl_put(_description_cache, cache_key, data, _DESCRIPTION_CACHE_SIZE)
+    return data
 
 async def get_record_details(table_name: str, record_number: str) -> dict[str, Any]:
     """Generic function to get detailed information for any record."""
-    fields = DETAIL_FIELDS.get(table_name, ["number", "short_description"])
+    fields_param = _FIELDS_PARAMS.get((table_name, True), _DEFAULT_FIELDS_PARAM)
     query = f"number={record_number}"
     # Apply category filtering for incidents
     query = _apply_incident_category_filter(table_name, query)
     # Apply catalog filtering for service catalog tables
     query = _apply_sc_catalog_filter(table_name, query)
-    url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={','.join(fields)}&sysparm_query={query}&sysparm_display_value=true"
+    url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={fields_param}&sysparm_query={query}&sysparm_display_value=true&sysparm_limit=1"
     data = await make_nws_request(url)
     return data if data else {"result": [], "message": RECORD_NOT_FOUND}
 
@@ -549,6 +645,17 @@ def _handle_exact_match_condition(field: str, value: str) -> str:
     return f"{field}={value}"
 
 
+# Condition handler registry ordered by specificity, built once at import
+_CONDITION_HANDLERS = (
+    _handle_date_range_condition,
+    _handle_priority_condition,
+    _handle_caller_exclusion_condition,
+    _handle_bare_or_value_condition,
+    _handle_servicenow_filter_condition,
+    _handle_operator_condition,
+    _handle_suffix_operator_condition,
+)
+
 def _build_query_condition(field: str, value: str) -> str:
     """Build a single query condition based on field and value."""
     # Handle special complete query cases first
@@ -557,19 +664,8 @@ def _build_query_condition(field: str, value: str) -> str:
     if field == "_complete_caller_exclusion":
         return value  # Already in complete ServiceNow format
 
-    # Condition handler registry ordered by specificity
-    condition_handlers = [
-        _handle_date_range_condition,
-        _handle_priority_condition,
-        _handle_caller_exclusion_condition,
-        _handle_bare_or_value_condition,
-        _handle_servicenow_filter_condition,
-        _handle_operator_condition,
-        _handle_suffix_operator_condition,
-    ]
-    
     # Try each condition handler until one matches
-    for handler in condition_handlers:
+    for handler in _CONDITION_HANDLERS:
         result = handler(field, value)
         if result is not None:
             return result
@@ -581,16 +677,11 @@ def _build_query_string(filters: Dict[str, str]) -> str:
     """Build the complete query string from filters."""
     if not filters:
         return ""
-    
-    query_parts = []
-    for field, value in filters.items():
-        query_parts.append(_build_query_condition(field, value))
-    
-    return "^".join(query_parts)
+
+    return "^".join(_build_query_condition(field, value) for field, value in filters.items())
 
 def _encode_query_string(query_string: str) -> str:
     """URL encode query string while preserving ServiceNow JavaScript functions and operators."""
-    from urllib.parse import quote
     # Preserve ServiceNow-specific characters: =<>&^():@!
     # Added '@' for JavaScript separators, '!' for NOT EQUALS, '^' for AND/OR operators
     return quote(query_string, safe='=<>&^():@!')
@@ -626,7 +717,9 @@ async def _make_paginated_request(
     offset = 0
 
     while len(all_results) < max_results:
-        paginated_url = f"{url}&sysparm_offset={offset}&sysparm_limit={page_size}"
+        # Never ask for more rows than the caller keeps, so bodies stay small
+        limit = min(page_size, max_results - len(all_results))
+        paginated_url = f"{url}&sysparm_offset={offset}&sysparm_limit={limit}"
         data = await make_nws_request(paginated_url)
         
         if not data or not data.get('result'):
@@ -638,11 +731,11 @@ async def _make_paginated_request(
         
         all_results.extend(batch_results)
         
-        # If we got less than page_size, we've reached the end
-        if len(batch_results) < page_size:
+        # If we got less than we asked for, we've reached the end
+        if len(batch_results) < limit:
             break
         
-        offset += page_size
+        offset += limit
     
     return all_results[:max_results]
 
@@ -972,8 +1065,8 @@ async def get_records_by_priority(
     if not table_config or not table_config.get("priority_field"):
         return {"error": TABLE_NO_PRIORITY_SUPPORT_ERROR.format(table_name=table_name)}
 
-    fields = DETAIL_FIELDS.get(table_name, []) if detailed else ESSENTIAL_FIELDS.get(table_name, [])
-    if not fields:
+    fields_param = _FIELDS_PARAMS.get((table_name, detailed))
+    if not fields_param:
         return {"error": NO_FIELD_CONFIG_ERROR.format(table_name=table_name)}
 
     # Build priority filter
@@ -987,7 +1080,7 @@ async def get_records_by_priority(
     final_query = "^".join(filters)
     final_query = _apply_incident_category_filter(table_name, final_query)
     final_query = _apply_sc_catalog_filter(table_name, final_query)
-    base_url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={','.join(fields)}&sysparm_display_value=true"
+    base_url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={fields_param}&sysparm_display_value=true"
 
     if final_query:
         base_url += f"&sysparm_query={final_query}"
@@ -1005,8 +1098,8 @@ async def query_table_with_generic_filters(
     detailed: bool = False
 ) -> Dict[str, Any]:
     """Generic function to query any table with filters."""
-    fields = DETAIL_FIELDS.get(table_name, []) if detailed else ESSENTIAL_FIELDS.get(table_name, [])
-    if not fields:
+    fields_param = _FIELDS_PARAMS.get((table_name, detailed))
+    if not fields_param:
         return {"error": NO_FIELD_CONFIG_ERROR.format(table_name=table_name)}
     
     # Build query from filters using the same handler chain as query_table_with_filters
@@ -1019,7 +1112,7 @@ async def query_table_with_generic_filters(
     query = _apply_incident_category_filter(table_name, query)
     # Apply catalog filtering for service catalog tables
     query = _apply_sc_catalog_filter(table_name, query)
-    base_url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={','.join(fields)}&sysparm_display_value=true"
+    base_url = f"{NWS_API_BASE}/api/now/table/{table_name}?sysparm_fields={fields_param}&sysparm_display_value=true"
 
     if query:
         base_url += f"&sysparm_query={query}"
@@ -5,6 +5,7 @@ Each function validates the table name against TABLE_CONFIGS and delegates
 to the corresponding generic function in generic_table_tools.py.
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional
 from constants import TABLE_CONFIGS, ESSENTIAL_FIELDS, DETAIL_FIELDS
 from .generic_table_tools import (
@@ -19,6 +20,8 @@ from .generic_table_tools import (
 
 SUPPORTED_TABLES = sorted(TABLE_CONFIGS.keys())
 INVALID_TABLE_ERROR = "Invalid table '{table}'. Supported tables: {tables}"
+# Tables search_across_tables covers when the caller names none.
+DEFAULT_CROSS_SEARCH_TABLES = ("incident", "change_request", "universal_request", "kb_knowledge")
 
 
 def _validate_table(table: str) -> Optional[Dict[str, Any]]:
@@ -49,6 +52,37 @@ async def search_records(table: str, query: str) -> Dict[str, Any]:
     return await query_table_by_text(table, query)
 
 
+async def search_across_tables(query: str, tables: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Search several ServiceNow tables by text similarity in one call.
+
+    Runs search_records for each table concurrently, so the total wait is
+    roughly that of the slowest table rather than the sum of all of them.
+
+    Supported tables: incident, change_request, sc_req_item, sc_task,
+    universal_request, kb_knowledge, vtb_task, task_sla.
+
+    Args:
+        query: Free-text search string
+        tables: Tables to search. Defaults to incident, change_request,
+            universal_request and kb_knowledge.
+
+    Returns:
+        {"result": {table: [...]}, "message": "..."}
+    """
+    tables = list(tables or DEFAULT_CROSS_SEARCH_TABLES)
+    for table in tables:
+        error = _validate_table(table)
+        if error:
+            return error
+    responses = await asyncio.gather(*(query_table_by_text(table, query) for table in tables))
+    results = {table: response.get("result", []) for table, response in zip(tables, responses)}
+    total = sum(len(records) for records in results.values())
+    return {
+        "result": results,
+        "message": f"Found {total} records across {len(tables)} tables",
+    }
+
+
 async def get_record_summary(table: str, number: str) -> Dict[str, Any]:
     """Get the short_description for a single record by its number.
 
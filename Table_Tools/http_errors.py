@@ -0,0 +1,31 @@
+"""Map ServiceNow HTTP status errors to tool-facing messages.
+
+Write tools share one lookup: each module supplies its own status -> message
+template table plus a fallback, and templates are formatted with
+``{operation}`` and, when they ask for it, ``{detail}`` (the decoded error
+body).
+"""
+from typing import Any, Mapping
+
+import httpx
+
+
+def _response_detail(response: httpx.Response) -> Any:
+    """Return the decoded error body, falling back to the raw text."""
+    try:
+        return response.json()
+    except Exception:
+        return response.text
+
+
+def format_http_error(
+    error: httpx.HTTPStatusError,
+    templates: Mapping[int, str],
+    default: str,
+    operation: str,
+) -> str:
+    """Format the template for ``error``'s status, or ``default`` if unmapped."""
+    template = templates.get(error.response.status_code, default)
+    if "{detail}" in template:
+        return template.format(operation=operation, detail=_response_detail(error.response))
+    return template.format(operation=operation)
@@ -20,21 +20,24 @@ from constants import (
     KB_PUBLISH_BATCH_CONCURRENCY,
     KB_PUBLISHED_STATE,
 )
+from Table_Tools.generic_table_tools import forget_record_description
+from Table_Tools.http_errors import format_http_error
+
+
+# Message template per HTTP status; 400s and server errors echo the response body.
+_KB_HTTP_ERROR_TEMPLATES = {
+    401: ERROR_KB_ARTICLE_AUTH_FAILED,
+    403: ERROR_KB_ARTICLE_ACCESS_DENIED,
+    400: ERROR_KB_ARTICLE_INVALID_REQUEST + ": {detail}",
+    404: ERROR_KB_ARTICLE_NOT_FOUND,
+}
+_KB_SERVER_ERROR_TEMPLATE = ERROR_KB_ARTICLE_SERVER_ERROR + ": {detail}"
 
 
 def _handle_kb_error(error: httpx.HTTPStatusError, operation: str) -> str:
-    status_code = error.response.status_code
-    try:
-        detail = error.response.json()
-    except Exception:
-        detail = error.response.text
-    error_messages = {
-        401: ERROR_KB_ARTICLE_AUTH_FAILED.format(operation=operation),
-        403: ERROR_KB_ARTICLE_ACCESS_DENIED.format(operation=operation),
-        400: f"{ERROR_KB_ARTICLE_INVALID_REQUEST.format(operation=operation)}: {detail}",
-        404: ERROR_KB_ARTICLE_NOT_FOUND.format(operation=operation),
-    }
-    return error_messages.get(status_code, f"{ERROR_KB_ARTICLE_SERVER_ERROR.format(operation=operation)}: {detail}")
+    return format_http_error(
+        error, _KB_HTTP_ERROR_TEMPLATES, _KB_SERVER_ERROR_TEMPLATE, operation
+    )
 
 
 def _unwrap_kb_write_response(result: Any, operation: str) -> Dict[str, Any] | str:
@@ -210,7 +213,9 @@ async def update_knowledge_article(article_number: str, update_data: Dict[str, A
         return ERROR_KB_ARTICLE_NOT_FOUND_OP.format(number=article_number)
     fields = ",".join(KB_WRITE_RESPONSE_FIELDS)
     url = f"{NWS_API_BASE}/api/now/table/kb_knowledge/{sys_id}?sysparm_fields={fields}"
-    return await _write_kb_article("PATCH", url, update_data, "update")
+    result = await _write_kb_article("PATCH", url, update_data, "update")
+    forget_record_description("kb_knowledge", article_number)
+    return result
 
 
 async def publish_knowledge_article(article_number: str) -> Dict[str, Any] | str:
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from http_layer import make_nws_request, NWS_API_BASE
 from typing import Any, Dict
 import httpx
@@ -12,19 +13,38 @@ from constants import (
     ERROR_PRIVATE_TASK_NOT_FOUND,
     ERROR_PRIVATE_TASK_SERVER_ERROR
 )
+from Table_Tools.generic_table_tools import forget_record_description
+from Table_Tools.http_errors import format_http_error
 
-def _handle_http_error(error: httpx.HTTPStatusError, operation: str) -> str:
-    """Handle HTTP errors consistently."""
-    status_code = error.response.status_code
+# Defaults for new tasks: New/Open state, moderate priority.
+_TASK_CREATE_DEFAULTS = {'state': '1', 'priority': '3'}
 
-    error_messages = {
-        401: ERROR_PRIVATE_TASK_AUTH_FAILED.format(operation=operation),
-        403: ERROR_PRIVATE_TASK_ACCESS_DENIED.format(operation=operation),
-        400: ERROR_PRIVATE_TASK_INVALID_REQUEST.format(operation=operation),
-        404: ERROR_PRIVATE_TASK_NOT_FOUND.format(operation=operation)
-    }
+# Fields copied from the caller's task data on create, in payload order.
+_TASK_CREATE_FIELDS = (
+    'state', 'priority', 'description', 'assigned_to', 'assignment_group',
+    'due_date', 'parent', 'comments', 'work_notes',
+)
+
+# Table endpoint built once at import; requests only append the record path.
+_VTB_TASK_URL = f"{NWS_API_BASE}/api/now/table/vtb_task"
 
-    return error_messages.get(status_code, ERROR_PRIVATE_TASK_SERVER_ERROR.format(operation=operation))
+# LRU cache of task number -> sys_id for resolved tasks.
+_SYS_ID_CACHE_SIZE = 1024
+_sys_id_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# Message template per HTTP status; anything else is reported as a server error.
+_HTTP_ERROR_TEMPLATES = {
+    401: ERROR_PRIVATE_TASK_AUTH_FAILED,
+    403: ERROR_PRIVATE_TASK_ACCESS_DENIED,
+    400: ERROR_PRIVATE_TASK_INVALID_REQUEST,
+    404: ERROR_PRIVATE_TASK_NOT_FOUND,
+}
+
+def _handle_http_error(error: httpx.HTTPStatusError, operation: str) -> str:
+    """Handle HTTP errors consistently."""
+    return format_http_error(
+        error, _HTTP_ERROR_TEMPLATES, ERROR_PRIVATE_TASK_SERVER_ERROR, operation
+    )
 
 def _unwrap_write_response(result: Any, operation: str) -> Dict[str, Any] | str:
     """Extract the inner result payload from a write response."""
@@ -37,11 +57,18 @@ async def _write_private_task(
     url: str,
     payload: Dict[str, Any],
     operation: str,
+    task_number: str | None = None,
 ) -> Dict[str, Any] | str:
-    """Send a write request through make_nws_request, mapping errors locally."""
+    """Send a write request through make_nws_request, mapping errors locally.
+
+    A 404 for a known ``task_number`` means its cached sys_id is stale (the
+    task was deleted), so the cache entry is dropped.
+    """
     try:
         result = await make_nws_request(url, method=method, json_data=payload)
     except httpx.HTTPStatusError as e:
+        if task_number is not None and e.response.status_code == 404:
+            _sys_id_cache.pop(task_number, None)
         return _handle_http_error(e, operation)
     except Exception:
         return ERROR_PRIVATE_TASK_REQUEST_FAILED.format(operation=operation)
@@ -52,31 +79,36 @@ def _prepare_task_create_data(task_data: Dict[str, Any]) -> Dict[str, Any]:
     """Prepare and validate data for task creation."""
     create_data = {
         'short_description': task_data['short_description'],
-        'state': task_data.get('state', '1'),  # Default to New/Open state
-        'priority': task_data.get('priority', '3'),  # Default to moderate priority
+        **_TASK_CREATE_DEFAULTS,
     }
-
-    # Add optional fields if provided
-    optional_fields = [
-        'description', 'assigned_to', 'assignment_group', 'due_date',
-        'parent', 'comments', 'work_notes'
-    ]
-
-    for field in optional_fields:
-        if field in task_data:
-            create_data[field] = task_data[field]
-
+    # Caller values win over the defaults; unknown fields are dropped
+    create_data.update(
+        {field: task_data[field] for field in _TASK_CREATE_FIELDS if field in task_data}
+    )
     return create_data
 
 async def _get_task_sys_id(task_number: str) -> str | None:
-    """Get the sys_id for a task by its number."""
-    sys_id_url = f"{NWS_API_BASE}/api/now/table/vtb_task?sysparm_fields=sys_id&sysparm_query=number={task_number}"
+    """Get the sys_id for a task by its number.
+
+    A task number never changes its sys_id, so hits are served from an LRU
+    cache. Misses are not cached: the task may be created later.
+    """
+    sys_id = _sys_id_cache.get(task_number)
+    if sys_id is not None:
+        _sys_id_cache.move_to_end(task_number)
+        return sys_id
+
+    sys_id_url = f"{_VTB_TASK_URL}?sysparm_fields=sys_id&sysparm_query=number={task_number}"
     sys_id_data = await make_nws_request(sys_id_url)
 
     if not sys_id_data or not sys_id_data.get('result') or not sys_id_data['result']:
         return None
 
-    return sys_id_data['result'][0]['sys_id']
+    sys_id = sys_id_data['result'][0]['sys_id']
+    _sys_id_cache[task_number] = sys_id
+    if len(_sys_id_cache) > _SYS_ID_CACHE_SIZE:
+        _sys_id_cache.popitem(last=False)
+    return sys_id
 
 async def create_private_task(task_data: Dict[str, Any]) -> dict[str, Any] | str:
     """Create a new private task record in ServiceNow.
@@ -93,7 +125,7 @@ async def create_private_task(task_data: Dict[str, Any]) -> dict[str, Any] | str
         return ERROR_SHORT_DESC_REQUIRED
 
     create_data = _prepare_task_create_data(task_data)
-    url = f"{NWS_API_BASE}/api/now/table/vtb_task"
+    url = _VTB_TASK_URL
 
     return await _write_private_task("POST", url, create_data, "creation")
 
@@ -114,5 +146,7 @@ async def update_private_task(task_number: str, update_data: Dict[str, Any]) ->
     if not sys_id:
         return PRIVATE_TASK_NOT_FOUND_UPDATE
 
-    url = f"{NWS_API_BASE}/api/now/table/vtb_task/{sys_id}"
-    return await _write_private_task("PATCH", url, update_data, "update")
+    url = f"{_VTB_TASK_URL}/{sys_id}"
+    result = await _write_private_task("PATCH", url, update_data, "update", task_number)
+    forget_record_description("vtb_task", task_number)
+    return result
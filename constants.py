@@ -19,6 +19,8 @@ NO_RECORDS_FOUND = "No records found."
 UNABLE_TO_FETCH_RECORDS = "Unable to fetch alerts or no alerts found."
 UNABLE_TO_FETCH_DETAILS = "Unable to fetch {record_type} details or no {record_type} found."
 NO_SIMILAR_RECORDS_FOUND = "No similar records found (only exact match)"
+MIN_SEARCH_TEXT_LENGTH = 3
+SEARCH_TEXT_TOO_SHORT = "Please provide at least {min_length} characters."
 REQUEST_FAILED_ERROR = "Request failed: {error}"
 NO_FIELD_CONFIG_ERROR = "No field configuration found for table {table_name}"
 NO_VALID_PRIORITIES_ERROR = "No valid priorities provided"
@@ -9,7 +9,8 @@ uses `IntelligentQueryParams` in `Table_Tools/intelligent_query_tools.py`.)
 Public API:
     Models:        TableFilterParams, QueryValidationResult
     Construction:  ServiceNowQueryBuilder
-    Validation:    validate_query_filters, validate_priority_filter,
+    Validation:    validate_query_filters, validate_query_filters_batch,
+                   validate_priority_filter,
                    validate_date_range_filter, validate_result_count,
                    suggest_query_improvements, debug_query_construction,
                    cross_verify_critical_incidents, build_pagination_params
@@ -29,6 +30,7 @@ from filter.validator import (
     validate_date_range_filter,
     validate_priority_filter,
     validate_query_filters,
+    validate_query_filters_batch,
     validate_result_count,
 )
 from filter.intelligence import (
@@ -55,6 +57,7 @@ __all__ = [
     "validate_date_range_filter",
     "validate_priority_filter",
     "validate_query_filters",
+    "validate_query_filters_batch",
     "validate_result_count",
     # NL parsing
     "QueryIntelligence",
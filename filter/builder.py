@@ -5,12 +5,45 @@ date ranges, exclusion clauses) for the ServiceNow REST API.
 """
 from __future__ import annotations
 
+import functools
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 
 
+# Relative periods with a fixed BETWEEN expression, keyed by lower-cased name.
+_RELATIVE_DATE_TEMPLATES: Dict[str, str] = {
+    "last week": "sys_created_onBETWEENjavascript:gs.beginningOfLastWeek()@javascript:gs.endOfLastWeek()",
+    "today": "sys_created_onBETWEENjavascript:gs.beginningOfToday()@javascript:gs.endOfToday()",
+    "last 7 days": "sys_created_onBETWEENjavascript:gs.daysAgoStart(7)@javascript:gs.daysAgoEnd(1)",
+    "this week": "sys_created_onBETWEENjavascript:gs.beginningOfThisWeek()@javascript:gs.endOfThisWeek()",
+}
+
+# Fixed pieces around the two dates of a BETWEEN date range filter.
+_BETWEEN_PREFIX = "sys_created_onBETWEENjavascript:gs.dateGenerate('"
+_BETWEEN_MIDDLE = "','00:00:00')@javascript:gs.dateGenerate('"
+_BETWEEN_SUFFIX = "','23:59:59')"
+
+# Pre-built OR clauses for the standard priorities 1-5.
+_PRIORITY_CLAUSE: Dict[str, str] = {str(i): f"priority={i}" for i in range(1, 6)}
+
+# additional_filters keys owned by dedicated build_complete_filter arguments.
+_RESERVED_ADDITIONAL_KEYS = frozenset({"sys_created_on", "priority", "caller_id"})
+
+# LRU cache of complete filter strings, keyed on the canonicalised arguments.
+_FILTER_CACHE_SIZE = 256
+_filter_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _typed_key(values) -> tuple:
+    """Cache-key form of a sequence: each value paired with its type."""
+    return tuple((type(value), value) for value in values)
+
+
 class ServiceNowQueryBuilder:
     """Helper class for building ServiceNow queries with proper syntax."""
 
+    __slots__ = ()
+
     @staticmethod
     def build_priority_or_filter(priorities: List[str]) -> str:
         """Build OR filter for multiple priorities."""
@@ -18,29 +51,21 @@ class ServiceNowQueryBuilder:
             return priorities[0]
 
         # Correct ServiceNow OR syntax: priority=1^ORpriority=2
-        priority_conditions = [f"priority={p}" for p in priorities]
+        priority_conditions = [_PRIORITY_CLAUSE.get(p) or f"priority={p}" for p in priorities]
         return "^OR".join(priority_conditions)
 
     @staticmethod
     def build_date_range_filter(start_date: str, end_date: str) -> str:
         """Build date range filter for ServiceNow using proper BETWEEN syntax."""
-        return (
-            f"sys_created_onBETWEENjavascript:gs.dateGenerate('{start_date}','00:00:00')"
-            f"@javascript:gs.dateGenerate('{end_date}','23:59:59')"
-        )
+        return "".join((_BETWEEN_PREFIX, start_date, _BETWEEN_MIDDLE, end_date, _BETWEEN_SUFFIX))
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def build_relative_date_filter(period: str = "Last week") -> str:
         """Build ServiceNow relative date filter with proper BETWEEN syntax."""
-        period_lower = period.lower()
-        if period_lower == "last week":
-            return "sys_created_onBETWEENjavascript:gs.beginningOfLastWeek()@javascript:gs.endOfLastWeek()"
-        if period_lower == "today":
-            return "sys_created_onBETWEENjavascript:gs.beginningOfToday()@javascript:gs.endOfToday()"
-        if period_lower == "last 7 days":
-            return "sys_created_onBETWEENjavascript:gs.daysAgoStart(7)@javascript:gs.daysAgoEnd(1)"
-        if period_lower == "this week":
-            return "sys_created_onBETWEENjavascript:gs.beginningOfThisWeek()@javascript:gs.endOfThisWeek()"
+        template = _RELATIVE_DATE_TEMPLATES.get(period.lower())
+        if template is not None:
+            return template
         # Fallback to standard range
         return f"sys_created_on>={period}"
 
@@ -65,36 +90,69 @@ class ServiceNowQueryBuilder:
             date_range: Tuple of (start_date, end_date) for specific range
             exclude_callers: List of caller sys_ids to exclude
             additional_filters: Additional field-value pairs
+
+        Results are cached (LRU) on the arguments, so rebuilding the same
+        filter for pagination or retries skips the string work.
         """
-        filter_parts: List[str] = []
+        # additional_filters keeps insertion order in the key: it decides
+        # the order of the emitted segments. Values carry their type, since
+        # equal-hashing values (True/1, 1.0/1) render differently.
+        key = (
+            _typed_key(priorities or ()),
+            date_period,
+            _typed_key(date_range) if date_range else None,
+            _typed_key(exclude_callers or ()),
+            tuple(
+                (field, type(value), value)
+                for field, value in (additional_filters or {}).items()
+            ),
+        )
+        try:
+            cached = _filter_cache.get(key)
+        except TypeError:  # unhashable argument value: build without caching
+            key = None
+            cached = None
+        if cached is not None:
+            _filter_cache.move_to_end(key)
+            return cached
+
+        segments: List[str] = []
 
         # Add date filter (specific range takes precedence)
         if date_range and len(date_range) == 2:
             start_date, end_date = date_range
-            filter_parts.append(
+            segments.append(
                 ServiceNowQueryBuilder.build_date_range_filter(start_date, end_date)
             )
         elif date_period:
-            filter_parts.append(
+            segments.append(
                 ServiceNowQueryBuilder.build_relative_date_filter(date_period)
             )
 
         # Add priority filter if specified
         if priorities:
-            filter_parts.append(
+            segments.append(
                 ServiceNowQueryBuilder.build_priority_or_filter(priorities)
             )
 
         # Add caller exclusion filter
         if exclude_callers:
-            filter_parts.append(
+            segments.append(
                 ServiceNowQueryBuilder.build_exclusion_filter("caller_id", exclude_callers)
             )
 
         # Add any additional filters
         if additional_filters:
-            for field, value in additional_filters.items():
-                if field not in ("sys_created_on", "priority", "caller_id"):
-                    filter_parts.append(f"{field}={value}")
+            segments.extend(
+                f"{field}={value}"
+                for field, value in additional_filters.items()
+                if field not in _RESERVED_ADDITIONAL_KEYS
+            )
 
-        return "^".join(filter_parts)
+        # Single join at the end; empty fragments would leave a stray "^"
+        result = "^".join(segment for segment in segments if segment)
+        if key is not None:
+            _filter_cache[key] = result
+            if len(_filter_cache) > _FILTER_CACHE_SIZE:
+                _filter_cache.popitem(last=False)
+        return result
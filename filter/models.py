@@ -1,6 +1,7 @@
 """Pydantic models and result containers for the filter pipeline."""
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -21,14 +22,14 @@ class TableFilterParams(BaseModel):
     )
 
 
+@dataclass(slots=True)
 class QueryValidationResult:
     """Container for query validation results."""
 
-    def __init__(self, is_valid: bool = True) -> None:
-        self.is_valid = is_valid
-        self.warnings: List[str] = []
-        self.suggestions: List[str] = []
-        self.corrected_filters: Optional[Dict[str, str]] = None
+    is_valid: bool = True
+    warnings: List[str] = field(default_factory=list)
+    suggestions: List[str] = field(default_factory=list)
+    corrected_filters: Optional[Dict[str, str]] = None
 
     def add_warning(self, warning: str) -> None:
         """Add a warning message."""
@@ -38,6 +39,11 @@ class QueryValidationResult:
         """Add a suggestion for improvement."""
         self.suggestions.append(suggestion)
 
+    def merge(self, other: QueryValidationResult) -> None:
+        """Fold another result's warnings and suggestions into this one."""
+        self.warnings.extend(other.warnings)
+        self.suggestions.extend(other.suggestions)
+
     def has_issues(self) -> bool:
         """True if the query is invalid or has warnings."""
-        return not self.is_valid or len(self.warnings) > 0
+        return not self.is_valid or bool(self.warnings)
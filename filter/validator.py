@@ -5,11 +5,21 @@ rather than raising, so callers can attach them to LLM-visible responses.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import re
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Tuple
 
 from filter.models import QueryValidationResult
 
 
+# Multi-needle checks compiled once so each runs as a single scan of the value;
+# single-literal checks stay as plain `in`, which is already one C-level scan.
+_PRIORITY_DIGIT_RE = re.compile(r"[123]")
+_NUMERIC_PRIORITY_RE = re.compile(r"=[1-5]")
+_TEXT_PRIORITY_RE = re.compile(r"Critical|High|Medium")
+_OLD_DATE_COMPARISON_RE = re.compile(r"[<>]=")
+
+
 # ---------------------------------------------------------------------------
 # Priority validation helpers
 # ---------------------------------------------------------------------------
@@ -33,7 +43,7 @@ def validate_priority_filter(priority_value: str) -> QueryValidationResult:
     """Validate priority filter syntax with enhanced debugging."""
     result = QueryValidationResult()
 
-    has_multiple_priorities = any(p in priority_value for p in ["1", "2", "3"])
+    has_multiple_priorities = _PRIORITY_DIGIT_RE.search(priority_value) is not None
     has_or_syntax = "^OR" in priority_value
     has_comma_syntax = "," in priority_value
 
@@ -53,8 +63,8 @@ def validate_priority_filter(priority_value: str) -> QueryValidationResult:
             "Ensure OR filters start with field name: 'priority=1^ORpriority=2'"
         )
 
-    has_numeric = any(p in priority_value for p in ["=1", "=2", "=3", "=4", "=5"])
-    has_text_format = any(t in priority_value for t in ["Critical", "High", "Medium"])
+    has_numeric = _NUMERIC_PRIORITY_RE.search(priority_value) is not None
+    has_text_format = _TEXT_PRIORITY_RE.search(priority_value) is not None
 
     if _should_suggest_numeric_format(has_text_format, has_numeric):
         result.add_suggestion(
@@ -70,7 +80,7 @@ def validate_date_range_filter(date_value: str) -> QueryValidationResult:
 
     has_between_syntax = "BETWEEN" in date_value
     has_javascript_dates = "javascript:gs." in date_value
-    has_old_comparison = ">=" in date_value or "<=" in date_value
+    has_old_comparison = _OLD_DATE_COMPARISON_RE.search(date_value) is not None
 
     if has_old_comparison and not has_between_syntax:
         result.add_warning(
@@ -104,23 +114,72 @@ def validate_date_range_filter(date_value: str) -> QueryValidationResult:
     return result
 
 
-def validate_query_filters(filters: Dict[str, str]) -> QueryValidationResult:
-    """Main filter validation function using dedicated helpers."""
+# Only these fields influence validate_query_filters, so the cache key is
+# built from them alone. Oldest entries are evicted first (dicts keep
+# insertion order).
+_VALIDATED_FIELDS = ("priority", "sys_created_on")
+_VALIDATION_CACHE_SIZE = 512
+_validation_cache: Dict[tuple, QueryValidationResult] = {}
+
+
+def _copy_result(result: QueryValidationResult) -> QueryValidationResult:
+    """Return a copy whose lists can be mutated without touching the original."""
+    copied = QueryValidationResult(result.is_valid)
+    copied.merge(result)
+    copied.corrected_filters = (
+        dict(result.corrected_filters) if result.corrected_filters is not None else None
+    )
+    return copied
+
+
+def _validate_query_filters_uncached(filters: Dict[str, str]) -> QueryValidationResult:
+    """Validate the priority and date fields without consulting the cache."""
     result = QueryValidationResult()
 
     for field, value in filters.items():
         if field == "priority":
-            priority_result = validate_priority_filter(value)
-            result.warnings.extend(priority_result.warnings)
-            result.suggestions.extend(priority_result.suggestions)
+            result.merge(validate_priority_filter(value))
         elif field == "sys_created_on":
-            date_result = validate_date_range_filter(value)
-            result.warnings.extend(date_result.warnings)
-            result.suggestions.extend(date_result.suggestions)
+            result.merge(validate_date_range_filter(value))
 
     return result
 
 
+def validate_query_filters(filters: Dict[str, str]) -> QueryValidationResult:
+    """Main filter validation function using dedicated helpers.
+
+    Results are cached on the validated fields; callers always get a fresh
+    copy, so mutating the returned result never leaks into the cache.
+    """
+    key = tuple(
+        (field, value) for field, value in filters.items() if field in _VALIDATED_FIELDS
+    )
+    try:
+        cached = _validation_cache.get(key)
+    except TypeError:  # unhashable filter value: validate without caching
+        return _validate_query_filters_uncached(filters)
+
+    if cached is None:
+        cached = _validate_query_filters_uncached(filters)
+        if len(_validation_cache) >= _VALIDATION_CACHE_SIZE:
+            del _validation_cache[next(iter(_validation_cache))]
+        _validation_cache[key] = cached
+
+    return _copy_result(cached)
+
+
+def validate_query_filters_batch(
+    filters_list: List[Dict[str, str]],
+) -> List[QueryValidationResult]:
+    """Validate many filter dicts, checking each distinct combination once.
+
+    Goes through the validate_query_filters cache, so dicts that share the
+    same priority / sys_created_on values reuse one validation pass; every
+    entry still gets its own result object.
+    """
+    return [validate_query_filters(filters) for filters in filters_list]
+
+
 # ---------------------------------------------------------------------------
 # Auto-correction
 # ---------------------------------------------------------------------------
@@ -229,46 +288,68 @@ def validate_result_count(
     return result
 
 
-def cross_verify_critical_incidents() -> Dict[str, Any]:
+# Read-only, so one instance is safely shared by every caller.
+_CROSS_VERIFY_RESULT: Mapping[str, Any] = MappingProxyType({
+    "missing_critical": (),
+    "verification_attempted": True,
+    "additional_found": 0,
+})
+
+
+def cross_verify_critical_incidents() -> Mapping[str, Any]:
     """Cross-verify that no P1 Critical incidents are missing."""
-    return {
-        "missing_critical": [],
-        "verification_attempted": True,
-        "additional_found": 0,
-    }
+    return _CROSS_VERIFY_RESULT
+
+
+# Pre-stringified defaults and common page sizes for build_pagination_params.
+_INT_STR_CACHE: Dict[int, str] = {i: str(i) for i in (0, 100, 250, 500, 1000, 5000)}
 
 
 def build_pagination_params(offset: int = 0, limit: int = 250) -> Dict[str, str]:
     """Build pagination parameters for ServiceNow queries."""
     return {
-        "sysparm_offset": str(offset),
-        "sysparm_limit": str(limit),
+        "sysparm_offset": _INT_STR_CACHE.get(offset) or str(offset),
+        "sysparm_limit": _INT_STR_CACHE.get(limit) or str(limit),
     }
 
 
+# (predicate on filters and result count, suggestions emitted when it matches)
+_SUGGESTION_RULES: Tuple[Tuple[Callable[[Dict[str, str], int], bool], Tuple[str, ...]], ...] = (
+    (
+        lambda filters, count: count == 0,
+        (
+            "Try broader date range or check filter syntax",
+            "Verify field names match ServiceNow schema",
+            "Check if date format is correct (YYYY-MM-DD)",
+            "Verify caller_id exclusions are not too restrictive",
+        ),
+    ),
+    (
+        lambda filters, count: "priority" in filters and count < 3,
+        (
+            "Consider using OR syntax: 'priority=1^ORpriority=2'",
+            "Check if priority values are numeric (1, 2) vs text ('1 - Critical')",
+        ),
+    ),
+    (
+        lambda filters, count: count > 1000,
+        (
+            "Consider adding more specific filters to reduce result set",
+            "Add date range or caller exclusions to narrow results",
+        ),
+    ),
+)
+
+
 def suggest_query_improvements(
     filters: Dict[str, str],
     result_count: int,
 ) -> List[str]:
     """Provide suggestions for query improvements."""
     suggestions: List[str] = []
-
-    if result_count == 0:
-        suggestions.append("Try broader date range or check filter syntax")
-        suggestions.append("Verify field names match ServiceNow schema")
-        suggestions.append("Check if date format is correct (YYYY-MM-DD)")
-        suggestions.append("Verify caller_id exclusions are not too restrictive")
-
-    if "priority" in filters and result_count < 3:
-        suggestions.append("Consider using OR syntax: 'priority=1^ORpriority=2'")
-        suggestions.append(
-            "Check if priority values are numeric (1, 2) vs text ('1 - Critical')"
-        )
-
-    if result_count > 1000:
-        suggestions.append("Consider adding more specific filters to reduce result set")
-        suggestions.append("Add date range or caller exclusions to narrow results")
-
+    for matches, rule_suggestions in _SUGGESTION_RULES:
+        if matches(filters, result_count):
+            suggestions.extend(rule_suggestions)
     return suggestions
 
 
@@ -6,7 +6,7 @@ token. Preserves every public method, attribute, and private method
 that v3 exposed so existing call sites and test patches continue to work:
 
     - public methods   : get_auth_headers, make_authenticated_request,
-                         test_connection
+                         test_connection, aclose
     - private methods  : _get_basic_auth_header, _request_access_token,
                          _get_valid_token, _clear_token_cache,
                          _retry_with_fresh_token, _process_response
@@ -155,6 +155,10 @@ class ServiceNowOAuthClient:
             method, url, raise_for_status=raise_for_status, **kwargs
         )
 
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections held by the executor."""
+        await self._executor.aclose()
+
     async def test_connection(self) -> Dict[str, Any]:
         """Test the OAuth connection by making a simple API call."""
         test_url = f"{self.instance_url}/api/now/table/sys_user?sysparm_limit=1"
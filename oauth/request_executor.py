@@ -1,7 +1,9 @@
 """Authenticated HTTP request execution with 401 retry.
 
 Owns the actual ``httpx.AsyncClient`` lifecycle for ServiceNow API calls
-and the retry-with-fresh-token policy for 401 responses. Read paths
+and the retry-with-fresh-token policy for 401 responses. One pooled
+client is created lazily and reused across requests so keep-alive
+connections skip the TCP + TLS handshake; ``aclose()`` releases it. Read paths
 swallow errors (return None); write paths re-raise so callers can map
 HTTP status codes to domain-specific error messages.
 
@@ -16,12 +18,16 @@ import json
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 import httpx
+import orjson
 
 from oauth.token_store import TokenStore
 
 
 AuthHeaderSource = Callable[[], Awaitable[Dict[str, str]]]
 
+# Connection pool bounds for the shared API client.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
 
 class RequestExecutor:
     """Make authenticated HTTP requests with token-refresh on 401."""
@@ -33,6 +39,21 @@ class RequestExecutor:
     ) -> None:
         self._get_auth_headers = get_auth_headers
         self._token_store = token_store
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use or after close."""
+        client = self._http_client
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(verify=True, limits=_POOL_LIMITS)
+            self._http_client = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled client; the next request opens a fresh one."""
+        client, self._http_client = self._http_client, None
+        if client is not None:
+            await client.aclose()
 
     async def make_authenticated_request(
         self,
@@ -61,34 +82,49 @@ class RequestExecutor:
             merged = dict(headers)
             merged.update(kwargs["headers"])
             headers = merged
-        kwargs["headers"] = headers
 
-        async with httpx.AsyncClient(verify=True) as client:
+        # Encode JSON bodies with orjson rather than httpx's stdlib encoder;
+        # non-str dict keys are stringified, as json.dumps did
+        body = kwargs.pop("json", None)
+        if body is not None:
             try:
-                response = await client.request(method, url, timeout=timeout, **kwargs)
-                response.raise_for_status()
-                return self._process_response(response)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 401:
-                    return await self._retry_with_fresh_token(
-                        client, method, url,
-                        raise_for_status=raise_for_status,
-                        timeout=timeout,
-                        **kwargs,
-                    )
-                if raise_for_status:
-                    raise
-                return None
-            except httpx.TimeoutException:
+                kwargs["content"] = orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
                 if raise_for_status:
                     raise
                 return None
-            except (httpx.RequestError, json.JSONDecodeError):
-                return None
+        kwargs["headers"] = headers
+
+        client = self._get_http_client()
+        try:
+            response = await client.request(method, url, timeout=timeout, **kwargs)
+            response.raise_for_status()
+            return self._process_response(response)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 401:
+                return await self._retry_with_fresh_token(
+                    client, method, url,
+                    raise_for_status=raise_for_status,
+                    timeout=timeout,
+                    **kwargs,
+                )
+            if raise_for_status:
+                raise
+            return None
+        except httpx.TimeoutException:
+            if raise_for_status:
+                raise
+            return None
+        except (httpx.RequestError, json.JSONDecodeError):
+            return None
 
     def _process_response(self, response: httpx.Response) -> Dict[str, Any]:
-        """Decode a successful response payload."""
-        return response.json()
+        """Decode a successful response payload.
+
+        orjson parses the raw bytes directly; its decode error subclasses
+        ``json.JSONDecodeError``, so the callers' handling is unchanged.
+        """
+        return orjson.loads(response.content)
 
     async def _retry_with_fresh_token(
         self,
@@ -108,7 +144,7 @@ class RequestExecutor:
         try:
             response = await client.request(method, url, timeout=timeout, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return self._process_response(response)
         except httpx.HTTPStatusError:
             if raise_for_status:
                 raise
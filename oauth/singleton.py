@@ -17,7 +17,7 @@ import httpx  # re-exported for tests that patch ``oauth.singleton.httpx.AsyncCl
 
 from oauth.client import ServiceNowOAuthClient
 
-__all__ = ["get_oauth_client", "make_oauth_request", "httpx"]
+__all__ = ["get_oauth_client", "make_oauth_request", "close_oauth_client", "httpx"]
 
 # Process-wide singleton. Tests reset it via ``oauth.singleton._oauth_client = None``.
 _oauth_client: Optional[ServiceNowOAuthClient] = None
@@ -35,3 +35,9 @@ async def make_oauth_request(url: str) -> Optional[dict[str, Any]]:
     """Convenience function for making OAuth-authenticated GET requests."""
     client = get_oauth_client()
     return await client.make_authenticated_request("GET", url)
+
+
+async def close_oauth_client() -> None:
+    """Close the global client's pooled connections (server shutdown hook)."""
+    if _oauth_client is not None:
+        await _oauth_client.aclose()
@@ -55,16 +55,32 @@ class TokenStore:
 
     # ---- public API -----------------------------------------------------
 
+    def _cached_token(self, now: datetime) -> Optional[str]:
+        """Return the cached token if it is outside the 5-minute refresh buffer."""
+        if (
+            self._access_token
+            and self._token_expires_at
+            and now < (self._token_expires_at - timedelta(minutes=5))
+        ):
+            return self._access_token
+        return None
+
     async def get_valid_token(self) -> str:
-        """Return a cached token or refresh if expired (with 5-minute buffer)."""
+        """Return a cached token or refresh if expired (with 5-minute buffer).
+
+        A still-valid token is returned without taking the lock; only a
+        refresh serialises, and it re-checks the cache once it holds the
+        lock so concurrent callers share a single token request.
+        """
+        token = self._cached_token(datetime.now())
+        if token is not None:
+            return token
+
         async with self._token_lock:
             now = datetime.now()
-            if (
-                self._access_token
-                and self._token_expires_at
-                and now < (self._token_expires_at - timedelta(minutes=5))
-            ):
-                return self._access_token
+            token = self._cached_token(now)
+            if token is not None:
+                return token
 
             token_data = await self._fetch_token_fn()
             self._access_token = token_data["access_token"]
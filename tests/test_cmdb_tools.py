@@ -11,7 +11,7 @@ Tests CMDB functionality with proper mocking to avoid live API calls.
 import unittest
 import sys
 import os
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch, AsyncMock
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
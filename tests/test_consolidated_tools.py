@@ -4,7 +4,7 @@ Wrapper tests removed in v3.0 (now covered by test_generic_tool_wrappers.py).
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch
 from typing import Dict, Any
 
 from Table_Tools.consolidated_tools import (
@@ -5,7 +5,7 @@ Tests date validation, normalization, and date range helper functions.
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from Table_Tools.date_utils import (
     validate_date_format,
@@ -18,7 +18,7 @@ import sys
 import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
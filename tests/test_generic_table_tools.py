@@ -4,7 +4,7 @@ Target: 85%+ line coverage, 70%+ branch coverage
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch, MagicMock
 from typing import Dict, List, Any
 
 from Table_Tools.generic_table_tools import (
@@ -33,6 +33,8 @@ from Table_Tools.generic_table_tools import (
     _make_paginated_request,
     query_table_by_text,
     get_record_description,
+    forget_record_description,
+    _description_cache,
     get_record_details,
     find_similar_records,
     query_table_with_filters,
@@ -495,6 +497,125 @@ class TestAsyncTableOperations:
             assert result["result"] == []
             assert "message" in result
 
+    async def test_query_table_by_text_single_or_query(self):
+        """Test that all keywords are searched with one OR-joined request."""
+        with patch("Table_Tools.generic_table_tools.extract_keywords") as mock_keywords, \
+             patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request:
+
+            mock_keywords.return_value = ["database", "outage"]
+            mock_request.return_value = [{"number": "INC001", "short_description": "Outage"}]
+
+            result = await query_table_by_text("incident", "database outage")
+
+            mock_request.assert_called_once()
+            called_url = mock_request.call_args[0][0]
+            assert "sysparm_query=short_descriptionCONTAINSdatabase^ORshort_descriptionCONTAINSoutage" in called_url
+            assert result["message"] == "Found 1 records matching 'database' or 'outage'"
+
+    async def test_query_table_by_text_no_keywords_skips_request(self):
+        """Test that text without keywords returns no records without a request."""
+        with patch("Table_Tools.generic_table_tools.extract_keywords") as mock_keywords, \
+             patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request:
+
+            mock_keywords.return_value = []
+
+            result = await query_table_by_text("incident", "a an the")
+
+            mock_request.assert_not_called()
+            assert result["result"] == []
+
+    @pytest.mark.parametrize("input_text", ["", "  ", "db", " x "])
+    async def test_query_table_by_text_too_short(self, input_text):
+        """Test that text under three characters is rejected before any work."""
+        with patch("Table_Tools.generic_table_tools.extract_keywords") as mock_keywords, \
+             patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request:
+
+            result = await query_table_by_text("incident", input_text)
+
+            assert result == {"result": [], "message": "Please provide at least 3 characters."}
+            mock_keywords.assert_not_called()
+            mock_request.assert_not_called()
+
+    async def test_query_table_by_text_repeat_served_from_cache(self):
+        """Test that repeating the same text search reuses the cached result."""
+        with patch("Table_Tools.generic_table_tools.extract_keywords") as mock_keywords, \
+             patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request:
+
+            mock_keywords.return_value = ["database"]
+            mock_request.return_value = [{"number": "INC001", "short_description": "Database issue"}]
+
+            first = await query_table_by_text("incident", "database server issue")
+            second = await query_table_by_text("incident", "database server issue")
+
+            assert second == first
+            mock_request.assert_called_once()
+
+    async def test_query_table_by_text_paraphrase_shares_cache(self):
+        """Test that rephrased text with the same keywords reuses the cached result."""
+        with patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request:
+            mock_request.return_value = [{"number": "INC001", "short_description": "Database outage"}]
+
+            first = await query_table_by_text("incident", "database outage")
+            second = await query_table_by_text("incident", "the OUTAGE on the database")
+
+            assert second == first
+            mock_request.assert_called_once()
+
+    async def test_query_table_by_text_hit_is_most_recently_used(self):
+        """Test that a cache hit protects the search from the next eviction."""
+        with patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request, \
+             patch("Table_Tools.generic_table_tools._TEXT_SEARCH_CACHE_SIZE", 2):
+            mock_request.return_value = [{"number": "INC001", "short_description": "Database issue"}]
+
+            await query_table_by_text("incident", "database")
+            await query_table_by_text("incident", "network")
+            await query_table_by_text("incident", "database")  # hit: now most recent
+            await query_table_by_text("incident", "printer")  # evicts network
+            assert mock_request.call_count == 3
+
+            await query_table_by_text("incident", "database")
+            assert mock_request.call_count == 3
+
+    async def test_query_table_by_text_caller_mutation_not_cached(self):
+        """Test that changing returned records does not change the cached result."""
+        with patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request:
+            mock_request.return_value = [{"number": "INC001", "short_description": "Database issue"}]
+
+            first = await query_table_by_text("incident", "database outage")
+            first["result"][0]["number"] = "INC999"
+            first["result"].append({"number": "INC002"})
+            second = await query_table_by_text("incident", "database outage")
+
+            assert second["result"] == [{"number": "INC001", "short_description": "Database issue"}]
+            mock_request.assert_called_once()
+
+    async def test_query_table_by_text_cache_expires(self):
+        """Test that cached text search results are refetched after the TTL."""
+        with patch("Table_Tools.generic_table_tools.extract_keywords") as mock_keywords, \
+             patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request, \
+             patch("Table_Tools.generic_table_tools._TEXT_SEARCH_TTL_SECONDS", 0.0):
+
+            mock_keywords.return_value = ["database"]
+            mock_request.return_value = [{"number": "INC001", "short_description": "Database issue"}]
+
+            await query_table_by_text("incident", "database server issue")
+            await query_table_by_text("incident", "database server issue")
+
+            assert mock_request.call_count == 2
+
+    async def test_query_table_by_text_empty_result_not_cached(self):
+        """Test that searches with no matches are retried rather than cached."""
+        with patch("Table_Tools.generic_table_tools.extract_keywords") as mock_keywords, \
+             patch("Table_Tools.generic_table_tools._make_paginated_request") as mock_request:
+
+            mock_keywords.return_value = ["nonexistent"]
+            mock_request.return_value = []
+
+            await query_table_by_text("incident", "nonexistent keyword")
+            await query_table_by_text("incident", "nonexistent keyword")
+
+            assert mock_request.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_record_description_success(self):
         """Test getting record description successfully."""
@@ -507,6 +628,66 @@ class TestAsyncTableOperations:
 
             assert result is not None
             assert "result" in result
+            called_url = mock_request.call_args[0][0]
+            assert "sysparm_fields=short_description&" in called_url
+            assert called_url.endswith("&sysparm_limit=1")
+
+    async def test_get_record_description_cached_until_forgotten(self):
+        """Test that descriptions are cached per record until a write forgets them."""
+        with patch("Table_Tools.generic_table_tools.make_nws_request") as mock_request:
+            mock_request.return_value = {
+                "result": [{"short_description": "Test description"}]
+            }
+
+            first = await get_record_description("incident", "INC001")
+            second = await get_record_description("incident", "INC001")
+            assert second == first
+            mock_request.assert_called_once()
+
+            forget_record_description("incident", "INC001")
+            await get_record_description("incident", "INC001")
+            assert mock_request.call_count == 2
+
+    async def test_get_record_description_hit_is_most_recently_used(self):
+        """Test that a cache hit protects the record from the next eviction."""
+        with patch("Table_Tools.generic_table_tools.make_nws_request") as mock_request, \
+             patch("Table_Tools.generic_table_tools._DESCRIPTION_CACHE_SIZE", 2):
+            mock_request.return_value = {"result": [{"short_description": "Test description"}]}
+
+            await get_record_description("incident", "INC001")
+            await get_record_description("incident", "INC002")
+            await get_record_description("incident", "INC001")  # hit: now most recent
+            await get_record_description("incident", "INC003")  # evicts INC002
+            assert mock_request.call_count == 3
+
+            await get_record_description("incident", "INC001")
+            assert mock_request.call_count == 3
+
+    async def test_get_record_description_stale_entry_dropped(self):
+        """Test that an expired description is removed and refetched."""
+        with patch("Table_Tools.generic_table_tools.make_nws_request") as mock_request, \
+             patch("Table_Tools.generic_table_tools._DESCRIPTION_TTL_SECONDS", 0.0):
+            mock_request.side_effect = [{"result": [{"short_description": "Test description"}]}, None]
+
+            await get_record_description("incident", "INC001")
+            await get_record_description("incident", "INC001")
+
+            assert mock_request.call_count == 2
+            assert ("incident", "INC001") not in _description_cache
+
+    async def test_get_record_description_caller_mutation_not_cached(self):
+        """Test that changing a returned record does not change the cached one."""
+        with patch("Table_Tools.generic_table_tools.make_nws_request") as mock_request:
+            mock_request.return_value = {"result": [{"short_description": "Test description"}]}
+
+            first = await get_record_description("incident", "INC001")
+            first["result"][0]["short_description"] = "Changed"
+            second = await get_record_description("incident", "INC001")
+            second["result"].clear()
+            third = await get_record_description("incident", "INC001")
+
+            assert third["result"] == [{"short_description": "Test description"}]
+            mock_request.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_record_description_not_found(self):
@@ -531,6 +712,7 @@ class TestAsyncTableOperations:
 
             assert result is not None
             assert "result" in result
+            assert mock_request.call_args[0][0].endswith("&sysparm_limit=1")
 
     @pytest.mark.asyncio
     async def test_find_similar_records_success(self):
@@ -936,3 +1118,34 @@ class TestPaginationSortIntegration:
             called_url = mock_request.call_args[0][0]
             assert "ORDERBYnumber" in called_url
             assert "ORDERBYDESCsys_created_on" not in called_url
+
+
+class TestPaginationPageSize:
+    """Test that _make_paginated_request never fetches more rows than it returns."""
+
+    async def test_limit_clamped_to_max_results(self):
+        """Test that a small max_results is requested as the page limit."""
+        with patch("Table_Tools.generic_table_tools.make_nws_request") as mock_request:
+            mock_request.return_value = {"result": [{"number": "INC001"}]}
+
+            url = "https://instance.service-now.com/api/now/table/incident?sysparm_query=priority=1"
+            await _make_paginated_request(url, max_results=10)
+
+            called_url = mock_request.call_args[0][0]
+            assert "sysparm_offset=0&sysparm_limit=10" in called_url
+
+    async def test_last_page_requests_only_remaining_rows(self):
+        """Test that the final page asks only for the rows still needed."""
+        with patch("Table_Tools.generic_table_tools.make_nws_request") as mock_request:
+            mock_request.side_effect = [
+                {"result": [{"number": f"INC{i:03d}"} for i in range(4)]},
+                {"result": [{"number": "INC004"}, {"number": "INC005"}]},
+            ]
+
+            url = "https://instance.service-now.com/api/now/table/incident?sysparm_query=priority=1"
+            results = await _make_paginated_request(url, max_results=6, page_size=4)
+
+            assert len(results) == 6
+            called_urls = [call.args[0] for call in mock_request.call_args_list]
+            assert "sysparm_offset=0&sysparm_limit=4" in called_urls[0]
+            assert "sysparm_offset=4&sysparm_limit=2" in called_urls[1]
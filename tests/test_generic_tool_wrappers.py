@@ -1,13 +1,14 @@
 """
-Tests for generic_tool_wrappers.py — the 5 generic MCP tools.
+Tests for generic_tool_wrappers.py — the 6 generic MCP tools.
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch
 
 from Table_Tools.generic_tool_wrappers import (
     _validate_table,
     search_records,
+    search_across_tables,
     get_record_summary,
     get_record,
     find_similar,
@@ -61,6 +62,37 @@ class TestSearchRecords:
             mock.assert_called_once_with("change_request", "upgrade")
 
 
+class TestSearchAcrossTables:
+    """Test search_across_tables generic tool."""
+
+    async def test_default_tables(self):
+        with patch("Table_Tools.generic_tool_wrappers.query_table_by_text") as mock:
+            mock.side_effect = lambda table, query: {"result": [{"table": table}]}
+            result = await search_across_tables("server down")
+            searched = [call.args for call in mock.call_args_list]
+            assert searched == [
+                ("incident", "server down"),
+                ("change_request", "server down"),
+                ("universal_request", "server down"),
+                ("kb_knowledge", "server down"),
+            ]
+            assert result["result"]["kb_knowledge"] == [{"table": "kb_knowledge"}]
+            assert result["message"] == "Found 4 records across 4 tables"
+
+    async def test_explicit_tables_with_missing_result(self):
+        with patch("Table_Tools.generic_tool_wrappers.query_table_by_text") as mock:
+            mock.return_value = {"message": "No records found."}
+            result = await search_across_tables("upgrade", ["change_request"])
+            mock.assert_called_once_with("change_request", "upgrade")
+            assert result["result"] == {"change_request": []}
+
+    async def test_invalid_table_skips_search(self):
+        with patch("Table_Tools.generic_tool_wrappers.query_table_by_text") as mock:
+            result = await search_across_tables("test", ["incident", "bad_table"])
+            mock.assert_not_called()
+            assert "bad_table" in result["error"]
+
+
 class TestGetRecordSummary:
     """Test get_record_summary generic tool."""
 
@@ -0,0 +1,57 @@
+"""
+Tests for Table_Tools/http_errors.py status -> message mapping.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+import httpx
+
+from Table_Tools.http_errors import format_http_error
+
+
+_TEMPLATES = {
+    401: "{operation}: Authentication failed",
+    400: "{operation}: Invalid request: {detail}",
+}
+_DEFAULT = "{operation}: Server error"
+
+
+def _make_http_status_error(status_code: int, body=None, text: str = "") -> httpx.HTTPStatusError:
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    if body is None:
+        response.json.side_effect = ValueError("no json")
+    else:
+        response.json.return_value = body
+    return httpx.HTTPStatusError(str(status_code), request=MagicMock(), response=response)
+
+
+@pytest.mark.parametrize("status_code, expected", [
+    pytest.param(401, "update: Authentication failed", id="mapped"),
+    pytest.param(503, "update: Server error", id="default"),
+])
+def test_format_http_error_templates(status_code, expected):
+    """Test that mapped statuses use their template and others the default."""
+    assert format_http_error(_make_http_status_error(status_code), _TEMPLATES, _DEFAULT, "update") == expected
+
+
+def test_format_http_error_detail_from_json():
+    """Test that {detail} is filled from the decoded response body."""
+    error = _make_http_status_error(400, body={"error": "bad field"})
+    result = format_http_error(error, _TEMPLATES, _DEFAULT, "create")
+    assert result == "create: Invalid request: {'error': 'bad field'}"
+
+
+def test_format_http_error_detail_falls_back_to_text():
+    """Test that {detail} uses the raw text when the body is not JSON."""
+    error = _make_http_status_error(400, text="Bad Request")
+    result = format_http_error(error, _TEMPLATES, _DEFAULT, "create")
+    assert result == "create: Invalid request: Bad Request"
+
+
+def test_format_http_error_skips_body_without_detail():
+    """Test that the body is not decoded when the template has no {detail}."""
+    error = _make_http_status_error(401, body={"error": "expired"})
+    format_http_error(error, _TEMPLATES, _DEFAULT, "update")
+    error.response.json.assert_not_called()
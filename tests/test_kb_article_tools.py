@@ -850,7 +850,7 @@ class TestWritePathTimeoutPropagation:
             captured.update(kwargs)
             resp = MagicMock()
             resp.status_code = 200
-            resp.json.return_value = {"ok": True}
+            resp.content = b'{"ok": true}'
             resp.raise_for_status = MagicMock()
             return resp
 
@@ -9,7 +9,7 @@ Provides comprehensive coverage for SonarQube code coverage requirements.
 import unittest
 import sys
 import os
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch, AsyncMock
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -3,12 +3,16 @@ Comprehensive tests for oauth_client.py
 Target: 90%+ line coverage, 75%+ branch coverage
 """
 
+import base64
+import re
 import pytest
 import asyncio
 from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta
+from freezegun import freeze_time
 import httpx
 import json
+import orjson
 
 # Import classes and functions to test
 from oauth import (
@@ -20,7 +24,91 @@ from oauth import (
     get_oauth_client,
     make_oauth_request,
 )
-from oauth.singleton import _oauth_client
+import oauth.singleton
+
+# OAuth credentials every client-building test in this module runs with
+OAUTH_ENV = {
+    "SERVICENOW_INSTANCE": "https://test.service-now.com",
+    "SERVICENOW_CLIENT_ID": "test_id",
+    "SERVICENOW_CLIENT_SECRET": "test_secret",
+}
+
+# Wall-clock time TestTokenManagement runs under
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Basic Auth header the test credentials above must produce
+EXPECTED_BASIC_AUTH = "Basic " + base64.b64encode(b"test_id:test_secret").decode()
+
+# Transport/parse failures reused as mock side effects
+_JSON_ERR = json.JSONDecodeError("Invalid JSON", "", 0)
+_CONNECTION_ERR = httpx.RequestError("Connection failed")
+_TIMEOUT_ERR = httpx.TimeoutException("Timeout")
+
+# Captured at import: tests patch httpx.AsyncClient before building their mocks
+_ASYNC_CLIENT_SPEC = httpx.AsyncClient
+
+
+def make_mock_httpx(mock_client_class, post_return=None, post_side_effect=None,
+                    request_return=None, request_side_effect=None):
+    """Wire a patched httpx.AsyncClient so ``async with`` yields a client with canned post/request results."""
+    mock_client = AsyncMock(spec=_ASYNC_CLIENT_SPEC)
+    mock_client.__aenter__.return_value = mock_client
+    # An open client, so the executor's pool really reuses it
+    mock_client.is_closed = False
+    mock_client.post.return_value = post_return
+    mock_client.post.side_effect = post_side_effect
+    mock_client.request.return_value = request_return
+    mock_client.request.side_effect = request_side_effect
+    mock_client_class.return_value = mock_client
+    return mock_client
+
+
+def _status_error(status):
+    """Build the httpx.HTTPStatusError raised for a response with the given status."""
+    response = MagicMock()
+    response.status_code = status
+    return httpx.HTTPStatusError(str(status), request=MagicMock(), response=response)
+
+
+def _json_response(payload):
+    """Build a successful response whose body decodes to ``payload``."""
+    response = MagicMock()
+    response.content = orjson.dumps(payload)
+    return response
+
+
+def _undecodable_response():
+    """Build a successful response whose body is not valid JSON."""
+    response = MagicMock()
+    response.json.side_effect = _JSON_ERR
+    response.content = b"not json"
+    return response
+
+
+@pytest.fixture(autouse=True)
+def oauth_env(monkeypatch):
+    """Provide valid OAuth configuration; tests that need it missing clear it themselves."""
+    for name, value in OAUTH_ENV.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.fixture(scope="module")
+def _shared_client():
+    """One ServiceNowOAuthClient built for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in OAUTH_ENV.items():
+            mp.setenv(name, value)
+        return ServiceNowOAuthClient()
+
+
+@pytest.fixture
+def client(_shared_client):
+    """The shared client, with its token cache and pooled http client cleared after each test."""
+    yield _shared_client
+    _shared_client._access_token = None
+    _shared_client._token_expires_at = None
+    # Drop the pooled client so the next test's patched AsyncClient is used
+    _shared_client._executor._http_client = None
 
 
 class TestServiceNowOAuthExceptions:
@@ -52,11 +140,6 @@ class TestServiceNowOAuthExceptions:
 class TestServiceNowOAuthClientInit:
     """Test OAuth client initialization."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
     def test_init_with_valid_config(self):
         """Test initialization with valid configuration."""
         client = ServiceNowOAuthClient()
@@ -67,269 +150,94 @@ class TestServiceNowOAuthClientInit:
         assert client._access_token is None
         assert client._token_expires_at is None
 
-    @patch.dict("os.environ", {}, clear=True)
-    def test_init_missing_instance(self):
+    def test_init_missing_instance(self, monkeypatch):
         """Test initialization fails when SERVICENOW_INSTANCE is missing."""
-        with pytest.raises(ValueError) as exc_info:
+        for name in OAUTH_ENV:
+            monkeypatch.delenv(name)
+        with pytest.raises(ValueError, match="Missing OAuth configuration"):
             ServiceNowOAuthClient()
-        assert "Missing OAuth configuration" in str(exc_info.value)
 
-    @patch.dict("os.environ", {"SERVICENOW_INSTANCE": "https://test.service-now.com"}, clear=True)
-    def test_init_missing_client_id(self):
+    def test_init_missing_client_id(self, monkeypatch):
         """Test initialization fails when CLIENT_ID is missing."""
-        with pytest.raises(ValueError) as exc_info:
+        monkeypatch.delenv("SERVICENOW_CLIENT_ID")
+        monkeypatch.delenv("SERVICENOW_CLIENT_SECRET")
+        with pytest.raises(ValueError, match="Missing OAuth configuration"):
             ServiceNowOAuthClient()
-        assert "Missing OAuth configuration" in str(exc_info.value)
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id"
-    }, clear=True)
-    def test_init_missing_client_secret(self):
+    def test_init_missing_client_secret(self, monkeypatch):
         """Test initialization fails when CLIENT_SECRET is missing."""
-        with pytest.raises(ValueError) as exc_info:
+        monkeypatch.delenv("SERVICENOW_CLIENT_SECRET")
+        with pytest.raises(ValueError, match="Missing OAuth configuration"):
             ServiceNowOAuthClient()
-        assert "Missing OAuth configuration" in str(exc_info.value)
 
 
 class TestBasicAuthHeader:
     """Test Basic Auth header generation."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    def test_get_basic_auth_header(self):
+    def test_get_basic_auth_header(self, client):
         """Test Basic Auth header generation."""
-        client = ServiceNowOAuthClient()
-        header = client._get_basic_auth_header()
-
-        assert header.startswith("Basic ")
-        # Verify it's base64 encoded
-        import base64
-        encoded_part = header.replace("Basic ", "")
-        decoded = base64.b64decode(encoded_part).decode()
-        assert decoded == "test_id:test_secret"
+        assert client._get_basic_auth_header() == EXPECTED_BASIC_AUTH
 
 
+@patch("oauth.singleton.httpx.AsyncClient")
 class TestTokenRequest:
     """Test access token request functionality."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_request_access_token_success(self):
+    async def test_request_access_token_success(self, mock_client_class, client):
         """Test successful token request."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "access_token": "test_token_123",
-                "expires_in": 1800
-            }
-
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            result = await client._request_access_token()
-
-            assert result["access_token"] == "test_token_123"
-            assert result["expires_in"] == 1800
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_request_access_token_401_error(self):
-        """Test token request with 401 authentication error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 401
-
-            mock_error = httpx.HTTPStatusError(
-                "401 Unauthorized",
-                request=MagicMock(),
-                response=mock_response
-            )
-
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with pytest.raises(ServiceNowAuthenticationError) as exc_info:
-                await client._request_access_token()
-            assert "Invalid client credentials" in str(exc_info.value)
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_request_access_token_403_error(self):
-        """Test token request with 403 authorization error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 403
-
-            mock_error = httpx.HTTPStatusError(
-                "403 Forbidden",
-                request=MagicMock(),
-                response=mock_response
-            )
-
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with pytest.raises(ServiceNowAuthorizationError) as exc_info:
-                await client._request_access_token()
-            assert "Access denied" in str(exc_info.value)
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_request_access_token_500_error(self):
-        """Test token request with 500 server error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-
-            mock_error = httpx.HTTPStatusError(
-                "500 Server Error",
-                request=MagicMock(),
-                response=mock_response
-            )
-
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with pytest.raises(ServiceNowOAuthError) as exc_info:
-                await client._request_access_token()
-            assert "Server error" in str(exc_info.value)
-            assert "500" in str(exc_info.value)
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_request_access_token_connection_error(self):
-        """Test token request with connection error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(side_effect=httpx.RequestError("Connection failed"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with pytest.raises(ServiceNowConnectionError) as exc_info:
-                await client._request_access_token()
-            assert "Connection failed" in str(exc_info.value)
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_request_access_token_timeout_error(self):
-        """Test token request with timeout error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(side_effect=httpx.TimeoutException("Request timeout"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with pytest.raises(ServiceNowConnectionError) as exc_info:
-                await client._request_access_token()
-            assert "Connection failed" in str(exc_info.value)
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_request_access_token_json_decode_error(self):
-        """Test token request with JSON decode error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-
-            mock_client = MagicMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with pytest.raises(ServiceNowOAuthError) as exc_info:
-                await client._request_access_token()
-            assert "response parsing failed" in str(exc_info.value)
-
-
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "access_token": "test_token_123",
+            "expires_in": 1800
+        }
+
+        make_mock_httpx(mock_client_class, post_return=mock_response)
+
+        result = await client._request_access_token()
+
+        assert result["access_token"] == "test_token_123"
+        assert result["expires_in"] == 1800
+
+    @pytest.mark.parametrize("httpx_kwargs, expected_exc, message", [
+        pytest.param({"post_side_effect": _status_error(401)},
+                     ServiceNowAuthenticationError, "Invalid client credentials", id="401"),
+        pytest.param({"post_side_effect": _status_error(403)},
+                     ServiceNowAuthorizationError, "Access denied", id="403"),
+        pytest.param({"post_side_effect": _status_error(500)},
+                     ServiceNowOAuthError, "Server error (status 500)", id="500"),
+        pytest.param({"post_side_effect": _CONNECTION_ERR},
+                     ServiceNowConnectionError, "Connection failed", id="connection"),
+        pytest.param({"post_side_effect": _TIMEOUT_ERR},
+                     ServiceNowConnectionError, "Connection failed", id="timeout"),
+        pytest.param({"post_return": _undecodable_response()},
+                     ServiceNowOAuthError, "response parsing failed", id="json_decode"),
+    ])
+    async def test_request_access_token_errors(self, mock_client_class, client, httpx_kwargs, expected_exc, message):
+        """Test token request failures map to the matching OAuth exception."""
+        make_mock_httpx(mock_client_class, **httpx_kwargs)
+
+        with pytest.raises(expected_exc, match=re.escape(message)):
+            await client._request_access_token()
+
+
+@freeze_time(FROZEN_NOW)
 class TestTokenManagement:
     """Test token caching and refresh functionality."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_get_valid_token_when_none_exists(self):
+    async def test_get_valid_token_when_none_exists(self, client):
         """Test getting token when none exists."""
-        with patch.object(ServiceNowOAuthClient, "_request_access_token") as mock_request:
-            mock_request.return_value = {"access_token": "new_token", "expires_in": 1800}
-
-            client = ServiceNowOAuthClient()
+        with patch.object(ServiceNowOAuthClient, "_request_access_token", new=AsyncMock(return_value={"access_token": "new_token", "expires_in": 1800})) as mock_request:
             token = await client._get_valid_token()
 
             assert token == "new_token"
             assert client._access_token == "new_token"
-            assert client._token_expires_at is not None
+            assert client._token_expires_at == FROZEN_NOW + timedelta(seconds=1800)
             mock_request.assert_called_once()
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_get_valid_token_when_valid_exists(self):
+    async def test_get_valid_token_when_valid_exists(self, client):
         """Test using cached token when still valid."""
-        client = ServiceNowOAuthClient()
         client._access_token = "cached_token"
-        client._token_expires_at = datetime.now() + timedelta(minutes=10)
+        client._token_expires_at = FROZEN_NOW + timedelta(minutes=10)
 
         with patch.object(client, "_request_access_token") as mock_request:
             token = await client._get_valid_token()
@@ -337,57 +245,53 @@ class TestTokenManagement:
             assert token == "cached_token"
             mock_request.assert_not_called()
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_get_valid_token_when_expired(self):
+    async def test_get_valid_token_when_expired(self, client):
         """Test refreshing token when expired."""
-        client = ServiceNowOAuthClient()
         client._access_token = "expired_token"
-        client._token_expires_at = datetime.now() - timedelta(minutes=5)
-
-        with patch.object(client, "_request_access_token") as mock_request:
-            mock_request.return_value = {"access_token": "refreshed_token", "expires_in": 1800}
+        client._token_expires_at = FROZEN_NOW - timedelta(minutes=5)
 
+        with patch.object(client, "_request_access_token", new=AsyncMock(return_value={"access_token": "refreshed_token", "expires_in": 1800})) as mock_request:
             token = await client._get_valid_token()
 
             assert token == "refreshed_token"
             assert client._access_token == "refreshed_token"
             mock_request.assert_called_once()
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_get_auth_headers(self):
-        """Test getting authorization headers."""
-        client = ServiceNowOAuthClient()
+    async def test_get_valid_token_skips_lock_when_valid(self, client):
+        """Test that a valid cached token is returned even while a refresh holds the lock."""
+        client._access_token = "cached_token"
+        client._token_expires_at = FROZEN_NOW + timedelta(minutes=10)
+
+        async with client._token_lock:
+            task = asyncio.ensure_future(client._get_valid_token())
+            await asyncio.sleep(0)
+            done = task.done()
+            task.cancel()
 
-        with patch.object(client, "_get_valid_token") as mock_get_token:
-            mock_get_token.return_value = "test_token_abc"
+        assert done
+        assert task.result() == "cached_token"
+
+    async def test_concurrent_refresh_fetches_once(self, client):
+        """Test that concurrent callers with no token share a single refresh."""
+        with patch.object(client, "_request_access_token", new=AsyncMock(return_value={"access_token": "shared_token", "expires_in": 1800})) as mock_request:
+            tokens = await asyncio.gather(*(client._get_valid_token() for _ in range(5)))
+
+            assert tokens == ["shared_token"] * 5
+            mock_request.assert_called_once()
 
+    async def test_get_auth_headers(self, client):
+        """Test getting authorization headers."""
+        with patch.object(client, "_get_valid_token", new=AsyncMock(return_value="test_token_abc")):
             headers = await client.get_auth_headers()
 
             assert headers["Authorization"] == "Bearer test_token_abc"
             assert "Content-Type" in headers
             assert "Accept" in headers
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_clear_token_cache(self):
+    async def test_clear_token_cache(self, client):
         """Test clearing token cache."""
-        client = ServiceNowOAuthClient()
         client._access_token = "test_token"
-        client._token_expires_at = datetime.now()
+        client._token_expires_at = FROZEN_NOW
 
         await client._clear_token_cache()
 
@@ -395,207 +299,101 @@ class TestTokenManagement:
         assert client._token_expires_at is None
 
 
+@patch("oauth.singleton.httpx.AsyncClient")
 class TestAuthenticatedRequests:
     """Test making authenticated API requests."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_make_authenticated_request_success(self):
-        """Test successful authenticated request."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"result": "success"}
-
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer test_token"}
-
-                result = await client.make_authenticated_request("GET", "https://test.service-now.com/api/test")
-
-                assert result == {"result": "success"}
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_make_authenticated_request_with_retry_success(self):
-        """Test authenticated request with 401 and successful retry."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            # First response: 401
-            mock_response_401 = MagicMock()
-            mock_response_401.status_code = 401
-            mock_error = httpx.HTTPStatusError("401", request=MagicMock(), response=mock_response_401)
-
-            # Second response: Success
-            mock_response_200 = MagicMock()
-            mock_response_200.status_code = 200
-            mock_response_200.json.return_value = {"result": "success after retry"}
-
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(side_effect=[mock_error, mock_response_200])
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer test_token"}
-
-                result = await client.make_authenticated_request("GET", "https://test.service-now.com/api/test")
-
-                assert result == {"result": "success after retry"}
-                assert mock_client.request.call_count == 2  # Initial + retry
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_make_authenticated_request_non_401_error(self):
-        """Test authenticated request with non-401 HTTP error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_error = httpx.HTTPStatusError("500", request=MagicMock(), response=mock_response)
-
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer test_token"}
-
-                result = await client.make_authenticated_request("GET", "https://test.service-now.com/api/test")
-
-                assert result is None
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_make_authenticated_request_connection_error(self):
-        """Test authenticated request with connection error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(side_effect=httpx.RequestError("Connection failed"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer test_token"}
-
-                result = await client.make_authenticated_request("GET", "https://test.service-now.com/api/test")
-
-                assert result is None
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_make_authenticated_request_timeout_error(self):
-        """Test authenticated request with timeout."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer test_token"}
-
-                result = await client.make_authenticated_request("GET", "https://test.service-now.com/api/test")
-
+    @pytest.mark.parametrize("httpx_kwargs, expected, request_calls", [
+        pytest.param({"request_return": _json_response({"result": "success"})},
+                     {"result": "success"}, 1, id="success"),
+        pytest.param({"request_side_effect": [_status_error(401),
+                                              _json_response({"result": "success after retry"})]},
+                     {"result": "success after retry"}, 2, id="401_then_retry_success"),
+        pytest.param({"request_side_effect": _status_error(500)}, None, 1, id="non_401_error"),
+        pytest.param({"request_side_effect": _CONNECTION_ERR}, None, 1, id="connection_error"),
+        pytest.param({"request_side_effect": _TIMEOUT_ERR}, None, 1, id="timeout_error"),
+        pytest.param({"request_return": _undecodable_response()}, None, 1, id="json_decode_error"),
+    ])
+    async def test_make_authenticated_request(self, mock_client_class, client, httpx_kwargs, expected, request_calls):
+        """Test authenticated request outcomes, including the single 401 retry."""
+        mock_client = make_mock_httpx(mock_client_class, **httpx_kwargs)
+
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer test_token"})):
+            result = await client.make_authenticated_request("GET", "https://test.service-now.com/api/test")
+
+            assert result == expected
+            assert mock_client.request.call_count == request_calls
+
+
+@patch("oauth.singleton.httpx.AsyncClient")
+class TestJsonBodyEncoding:
+    """json= bodies are encoded with orjson before the request is sent."""
+
+    async def test_json_sent_as_orjson_content_on_first_try_and_retry(self, mock_client_class, client):
+        """Test that json= reaches client.request as orjson bytes, also on the 401 retry."""
+        body = {"short_description": "Disk full", "priority": 2}
+        mock_client = make_mock_httpx(
+            mock_client_class,
+            request_side_effect=[_status_error(401), _json_response({"result": "ok"})],
+        )
+
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer test_token"})):
+            result = await client.make_authenticated_request("POST", "https://test.service-now.com/api/test", json=body)
+
+        assert result == {"result": "ok"}
+        assert mock_client.request.call_count == 2
+        for call in mock_client.request.call_args_list:
+            assert call.kwargs["content"] == orjson.dumps(body)
+            assert "json" not in call.kwargs
+
+    async def test_non_str_keys_are_stringified(self, mock_client_class, client):
+        """Test that integer dict keys encode as strings, as json.dumps did."""
+        mock_client = make_mock_httpx(mock_client_class, request_return=_json_response({"result": "ok"}))
+
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer test_token"})):
+            await client.make_authenticated_request("POST", "https://test.service-now.com/api/test", json={1: "a"})
+
+        assert mock_client.request.call_args.kwargs["content"] == b'{"1":"a"}'
+
+    @pytest.mark.parametrize("raise_for_status", [False, True])
+    async def test_unencodable_body(self, mock_client_class, client, raise_for_status):
+        """Test that an unencodable body returns None, or raises on write paths."""
+        mock_client = make_mock_httpx(mock_client_class, request_return=_json_response({"result": "ok"}))
+        body = {"count": 2 ** 64}
+
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer test_token"})):
+            if raise_for_status:
+                with pytest.raises(TypeError):
+                    await client.make_authenticated_request(
+                        "POST", "https://test.service-now.com/api/test",
+                        raise_for_status=True, json=body,
+                    )
+            else:
+                result = await client.make_authenticated_request(
+                    "POST", "https://test.service-now.com/api/test", json=body
+                )
                 assert result is None
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_make_authenticated_request_json_decode_error(self):
-        """Test authenticated request with JSON decode error."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer test_token"}
-
-                result = await client.make_authenticated_request("GET", "https://test.service-now.com/api/test")
-
-                assert result is None
+        mock_client.request.assert_not_called()
 
 
 class TestConnectionTesting:
     """Test connection testing functionality."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_test_connection_success(self):
+    async def test_test_connection_success(self, client):
         """Test successful connection test."""
-        client = ServiceNowOAuthClient()
         client._token_expires_at = datetime.now() + timedelta(minutes=30)
 
-        with patch.object(client, "make_authenticated_request") as mock_request:
-            mock_request.return_value = {"result": [{"sys_id": "test"}]}
-
+        with patch.object(client, "make_authenticated_request", new=AsyncMock(return_value={"result": [{"sys_id": "test"}]})):
             result = await client.test_connection()
 
             assert result["status"] == "success"
             assert result["token_valid"] is True
             assert "expires_at" in result
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_test_connection_failure(self):
+    async def test_test_connection_failure(self, client):
         """Test failed connection test."""
-        client = ServiceNowOAuthClient()
-
-        with patch.object(client, "make_authenticated_request") as mock_request:
-            mock_request.return_value = None
-
+        with patch.object(client, "make_authenticated_request", new=AsyncMock(return_value=None)):
             result = await client.test_connection()
 
             assert result["status"] == "error"
@@ -605,204 +403,129 @@ class TestConnectionTesting:
 class TestGlobalClientInstance:
     """Test global client instance management."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    def test_get_oauth_client_creates_instance(self):
-        """Test that get_oauth_client creates instance."""
-        # Reset global client
-        import oauth.singleton
+    @pytest.fixture(autouse=True)
+    def _reset_global(self):
+        """Start and finish every test without a cached global client."""
         oauth.singleton._oauth_client = None
-
-        client = get_oauth_client()
-        assert client is not None
-        assert isinstance(client, ServiceNowOAuthClient)
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    def test_get_oauth_client_returns_same_instance(self):
-        """Test that get_oauth_client returns same instance."""
-        import oauth.singleton
+        yield
         oauth.singleton._oauth_client = None
 
+    def test_get_oauth_client_returns_singleton(self):
+        """Test that get_oauth_client creates one instance and keeps returning it."""
         client1 = get_oauth_client()
         client2 = get_oauth_client()
+        assert isinstance(client1, ServiceNowOAuthClient)
         assert client1 is client2
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
     async def test_make_oauth_request(self):
         """Test convenience make_oauth_request function."""
-        import oauth.singleton
-        oauth.singleton._oauth_client = None
-
-        with patch("oauth.client.ServiceNowOAuthClient.make_authenticated_request") as mock_request:
-            mock_request.return_value = {"result": "success"}
-
+        with patch("oauth.client.ServiceNowOAuthClient.make_authenticated_request", new=AsyncMock(return_value={"result": "success"})) as mock_request:
             result = await make_oauth_request("https://test.service-now.com/api/test")
 
             assert result == {"result": "success"}
             mock_request.assert_called_once()
 
 
+@patch("oauth.singleton.httpx.AsyncClient")
 class TestRetryWithFreshToken:
     """Test retry with fresh token functionality."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_retry_with_fresh_token_success(self):
+    async def test_retry_with_fresh_token_success(self, mock_client_class, client):
         """Test successful retry with fresh token."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"result": "success"}
+        mock_client = make_mock_httpx(mock_client_class, request_return=_json_response({"result": "success"}))
 
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer new_token"})):
+            result = await client._retry_with_fresh_token(
+                mock_client,
+                "GET",
+                "https://test.service-now.com/api/test"
+            )
 
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer new_token"}
+            assert result == {"result": "success"}
 
-                result = await client._retry_with_fresh_token(
-                    mock_client,
-                    "GET",
-                    "https://test.service-now.com/api/test"
-                )
+    async def test_retry_with_fresh_token_failure(self, mock_client_class, client):
+        """Test retry with fresh token that fails."""
+        mock_response = MagicMock()
+        mock_response.status_code = 401
+        mock_error = httpx.HTTPStatusError("401", request=MagicMock(), response=mock_response)
 
-                assert result == {"result": "success"}
+        mock_client = make_mock_httpx(mock_client_class, request_side_effect=mock_error)
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_retry_with_fresh_token_failure(self):
-        """Test retry with fresh token that fails."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 401
-            mock_error = httpx.HTTPStatusError("401", request=MagicMock(), response=mock_response)
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer new_token"})):
+            result = await client._retry_with_fresh_token(
+                mock_client,
+                "GET",
+                "https://test.service-now.com/api/test"
+            )
 
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
+            assert result is None
 
-            client = ServiceNowOAuthClient()
+    async def test_retry_with_fresh_token_raise_propagates(self, mock_client_class, client):
+        """retry_with_fresh_token re-raises HTTPStatusError when raise_for_status=True."""
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_error = httpx.HTTPStatusError("500", request=MagicMock(), response=mock_response)
 
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer new_token"}
+        mock_client = make_mock_httpx(mock_client_class, request_side_effect=mock_error)
 
-                result = await client._retry_with_fresh_token(
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer new_token"})):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._retry_with_fresh_token(
                     mock_client,
-                    "GET",
-                    "https://test.service-now.com/api/test"
+                    "POST",
+                    "https://test.service-now.com/api/test",
+                    raise_for_status=True,
                 )
 
-                assert result is None
-
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_retry_with_fresh_token_raise_propagates(self):
-        """retry_with_fresh_token re-raises HTTPStatusError when raise_for_status=True."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_error = httpx.HTTPStatusError("500", request=MagicMock(), response=mock_response)
-
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer new_token"}
-
-                with pytest.raises(httpx.HTTPStatusError):
-                    await client._retry_with_fresh_token(
-                        mock_client,
-                        "POST",
-                        "https://test.service-now.com/api/test",
-                        raise_for_status=True,
-                    )
-
 
+@patch("oauth.singleton.httpx.AsyncClient")
 class TestRaiseForStatusPropagation:
     """raise_for_status=True surfaces HTTPStatusError from write operations."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    @pytest.mark.asyncio
-    async def test_make_authenticated_request_raises_on_non_401(self):
+    async def test_make_authenticated_request_raises_on_non_401(self, mock_client_class, client):
         """raise_for_status=True propagates 4xx/5xx errors instead of returning None."""
-        with patch("oauth.singleton.httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 404
-            mock_error = httpx.HTTPStatusError("404", request=MagicMock(), response=mock_response)
-
-            mock_client = MagicMock()
-            mock_client.request = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            client = ServiceNowOAuthClient()
-            with patch.object(client, "get_auth_headers") as mock_headers:
-                mock_headers.return_value = {"Authorization": "Bearer test_token"}
-
-                with pytest.raises(httpx.HTTPStatusError):
-                    await client.make_authenticated_request(
-                        "POST",
-                        "https://test.service-now.com/api/test",
-                        raise_for_status=True,
-                    )
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_error = httpx.HTTPStatusError("404", request=MagicMock(), response=mock_response)
+
+        make_mock_httpx(mock_client_class, request_side_effect=mock_error)
+
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer test_token"})):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.make_authenticated_request(
+                    "POST",
+                    "https://test.service-now.com/api/test",
+                    raise_for_status=True,
+                )
 
 
 class TestProcessResponse:
     """Test response processing."""
 
-    @patch.dict("os.environ", {
-        "SERVICENOW_INSTANCE": "https://test.service-now.com",
-        "SERVICENOW_CLIENT_ID": "test_id",
-        "SERVICENOW_CLIENT_SECRET": "test_secret"
-    })
-    def test_process_response(self):
+    def test_process_response(self, client):
         """Test processing successful response."""
+        result = client._process_response(_json_response({"data": "test"}))
+
+        assert result == {"data": "test"}
+
+
+@patch("oauth.singleton.httpx.AsyncClient")
+class TestPooledHttpClient:
+    """The executor reuses one pooled httpx client until it is closed."""
+
+    async def test_requests_share_one_client_until_closed(self, mock_client_class):
+        """Test that requests reuse the pooled client and aclose() releases it."""
         client = ServiceNowOAuthClient()
+        mock_client = make_mock_httpx(mock_client_class, request_return=_json_response({"result": "ok"}))
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"data": "test"}
+        with patch.object(client, "get_auth_headers", new=AsyncMock(return_value={"Authorization": "Bearer test_token"})):
+            await client.make_authenticated_request("GET", "https://test.service-now.com/api/one")
+            await client.make_authenticated_request("GET", "https://test.service-now.com/api/two")
+            assert mock_client_class.call_count == 1
+            assert mock_client.request.call_count == 2
 
-        result = client._process_response(mock_response)
+            await client.aclose()
+            mock_client.aclose.assert_awaited_once()
 
-        assert result == {"data": "test"}
+            await client.make_authenticated_request("GET", "https://test.service-now.com/api/three")
+            assert mock_client_class.call_count == 2
@@ -1,359 +1,296 @@
 #!/usr/bin/env python3
 """
-unittest version of ServiceNow API tests.
+pytest version of ServiceNow API tests.
 
 Tests the service_now_api_oauth.py module functionality with proper mocking
 to avoid live API calls and achieve comprehensive coverage.
 """
 
-import unittest
-import sys
-import os
-from unittest.mock import patch, AsyncMock, MagicMock
-
-# Add the project root to the path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
-class TestServiceNowAPI(unittest.IsolatedAsyncioTestCase):
-    """Test suite for ServiceNow API functionality."""
-
-    async def asyncSetUp(self):
-        """Set up test fixtures for async tests."""
-        try:
-            from http_layer.response_parser import (
-                extract_field_value as _extract_field_value,
-                process_item_dict as _process_item_dict,
-                extract_display_values as _extract_display_values,
-            )
-            from http_layer.url_builder import (
-                ensure_query_encoded as _ensure_query_encoded,
-                add_default_params as _add_default_params,
-            )
-            from http_layer import make_nws_request, NWS_API_BASE
-            self.api_available = True
-            self._extract_field_value = _extract_field_value
-            self._process_item_dict = _process_item_dict
-            self._extract_display_values = _extract_display_values
-            self._ensure_query_encoded = _ensure_query_encoded
-            self._add_default_params = _add_default_params
-            self.make_nws_request = make_nws_request
-            self.NWS_API_BASE = NWS_API_BASE
-        except ImportError as e:
-            self.api_available = False
-            self.import_error = str(e)
-
-    async def test_extract_field_value_with_display_value(self):
-        """Test extracting field value when display_value is available."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        test_value = {
-            'value': 'raw_value',
-            'display_value': 'Human Readable Value'
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlsplit
+from unittest.mock import MagicMock
+
+import pytest
+
+# Skip the whole module at collection time when the code under test is missing.
+pytest.importorskip("http_layer", reason="ServiceNow API not available")
+
+
+# Shared parser fixtures; read-only so no test can mutate them for another.
+_RAW_ITEM = MappingProxyType({
+    'number': {'value': 'INC001001', 'display_value': 'INC001001'},
+    'state': {'value': '1', 'display_value': 'New'},
+    'simple_field': 'simple_value'
+})
+_EXPECTED_PROCESS_ITEM = MappingProxyType({
+    'number': 'INC001001',
+    'state': 'New',
+    'simple_field': 'simple_value'
+})
+_RAW_RESPONSE = MappingProxyType({
+    'result': [
+        {
+            'number': {'value': 'INC001001', 'display_value': 'INC001001'},
+            'state': {'value': '1', 'display_value': 'New'}
+        }
+    ]
+})
+_EXPECTED_DISPLAY_VALUES = MappingProxyType({
+    'result': [
+        {
+            'number': 'INC001001',
+            'state': 'New'
         }
+    ]
+})
 
-        result = self._extract_field_value(test_value)
-        self.assertEqual(result, 'Human Readable Value')
 
-    async def test_extract_field_value_simple_value(self):
-        """Test extracting simple non-dict values."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
+@pytest.mark.parametrize("value,expected", [
+    pytest.param(
+        {'value': 'raw_value', 'display_value': 'Human Readable Value'},
+        'Human Readable Value',
+        id="display_value",
+    ),
+    pytest.param("simple_string", "simple_string", id="string"),
+    pytest.param(12345, 12345, id="int"),
+])
+def test_extract_field_value(http_api, value, expected):
+    """Test extracting display values from dicts and passing simple values through."""
+    assert http_api._extract_field_value(value) == expected
 
-        result = self._extract_field_value("simple_string")
-        self.assertEqual(result, "simple_string")
 
-        result = self._extract_field_value(12345)
-        self.assertEqual(result, 12345)
+def test_process_item_dict_success(http_api):
+    """Test processing a dictionary item with mixed field types."""
+    result = http_api._process_item_dict(_RAW_ITEM)
 
-    async def test_process_item_dict_success(self):
-        """Test processing a dictionary item with mixed field types."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
+    assert result == _EXPECTED_PROCESS_ITEM
 
-        test_item = {
-            'number': {'value': 'INC001001', 'display_value': 'INC001001'},
-            'state': {'value': '1', 'display_value': 'New'},
-            'simple_field': 'simple_value'
-        }
 
-        result = self._process_item_dict(test_item)
+@pytest.mark.parametrize("data,expected", [
+    # extract_display_values only walks real dicts, so hand it a copy
+    pytest.param(dict(_RAW_RESPONSE), _EXPECTED_DISPLAY_VALUES, id="with_results"),
+    pytest.param("string_input", "string_input", id="non_dict_input"),
+])
+def test_extract_display_values(http_api, data, expected):
+    """Test extracting display values from API responses and non-dict input."""
+    assert http_api._extract_display_values(data) == expected
 
-        expected = {
-            'number': 'INC001001',
-            'state': 'New',
-            'simple_field': 'simple_value'
-        }
 
-        self.assertEqual(result, expected)
+# --- _ensure_query_encoded tests ---
 
-    async def test_extract_display_values_with_results(self):
-        """Test extracting display values from API response with results."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
+def test_ensure_query_encoded_no_sysparm_query(http_api):
+    """Test that URLs without sysparm_query pass through unchanged."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_limit=10"
+    result = http_api._ensure_query_encoded(url)
+    assert result == url
 
-        test_data = {
-            'result': [
-                {
-                    'number': {'value': 'INC001001', 'display_value': 'INC001001'},
-                    'state': {'value': '1', 'display_value': 'New'}
-                }
-            ]
-        }
 
-        result = self._extract_display_values(test_data)
+def test_ensure_query_encoded_spaces(http_api):
+    """Test that spaces in query values are percent-encoded."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSserver down"
+    result = http_api._ensure_query_encoded(url)
+    assert "sysparm_query=short_descriptionCONTAINSserver%20down" in result
 
-        expected = {
-            'result': [
-                {
-                    'number': 'INC001001',
-                    'state': 'New'
-                }
-            ]
-        }
 
-        self.assertEqual(result, expected)
-
-    async def test_extract_display_values_non_dict_input(self):
-        """Test extracting display values from non-dict input."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        result = self._extract_display_values("string_input")
-        self.assertEqual(result, "string_input")
-
-    # --- _ensure_query_encoded tests ---
-
-    async def test_ensure_query_encoded_no_sysparm_query(self):
-        """Test that URLs without sysparm_query pass through unchanged."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_limit=10"
-        result = self._ensure_query_encoded(url)
-        self.assertEqual(result, url)
-
-    async def test_ensure_query_encoded_spaces(self):
-        """Test that spaces in query values are percent-encoded."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSserver down"
-        result = self._ensure_query_encoded(url)
-        self.assertIn("sysparm_query=short_descriptionCONTAINSserver%20down", result)
-
-    async def test_ensure_query_encoded_preserves_sn_operators(self):
-        """Test that ServiceNow operators (=, ^, <, >, etc.) are preserved."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_query=priority=1^state=2^ORstate=3"
-        result = self._ensure_query_encoded(url)
-        self.assertEqual(result, url)
-
-    async def test_ensure_query_encoded_hash_character(self):
-        """Test that # in query is encoded to prevent URL fragment issues."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSissue #123"
-        result = self._ensure_query_encoded(url)
-        self.assertIn("sysparm_query=short_descriptionCONTAINSissue%20%23123", result)
-        self.assertNotIn("#", result.split("sysparm_query=")[1].split("&")[0])
-
-    async def test_ensure_query_encoded_idempotent(self):
-        """Test that already-encoded URLs are not double-encoded."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSserver%20down"
-        result = self._ensure_query_encoded(url)
-        self.assertIn("server%20down", result)
-        self.assertNotIn("%2520", result)
-
-    async def test_ensure_query_encoded_preserves_other_params(self):
-        """Test that other URL parameters are not affected by encoding."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_fields=number&sysparm_query=short_descriptionCONTAINSserver down&sysparm_limit=10"
-        result = self._ensure_query_encoded(url)
-        self.assertIn("sysparm_fields=number", result)
-        self.assertIn("sysparm_query=short_descriptionCONTAINSserver%20down", result)
-        self.assertIn("sysparm_limit=10", result)
-
-    # --- _add_default_params tests ---
-
-    async def test_add_default_params_no_query_string(self):
-        """Test adding params to URL with no existing query string."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident"
-        result = self._add_default_params(url)
-
-        self.assertIn("?", result)
-        self.assertIn("sysparm_display_value=true", result)
-        self.assertIn("sysparm_exclude_reference_link=true", result)
-        self.assertIn("sysparm_no_count=true", result)
-
-    async def test_add_default_params_existing_query_string(self):
-        """Test adding params to URL that already has a query string."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_fields=number"
-        result = self._add_default_params(url)
-
-        self.assertIn("sysparm_fields=number", result)
-        self.assertIn("&sysparm_display_value=true", result)
-        self.assertIn("sysparm_exclude_reference_link=true", result)
-        self.assertIn("sysparm_no_count=true", result)
-        self.assertEqual(result.count("?"), 1)
-
-    async def test_add_default_params_display_value_false(self):
-        """Test that display_value=False skips sysparm_display_value but adds perf params."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident"
-        result = self._add_default_params(url, display_value=False)
-
-        self.assertNotIn("sysparm_display_value", result)
-        self.assertIn("sysparm_exclude_reference_link=true", result)
-        self.assertIn("sysparm_no_count=true", result)
-
-    async def test_add_default_params_idempotent(self):
-        """Test that params are not duplicated when already present."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = (
-            "https://test.service-now.com/api/now/table/incident"
-            "?sysparm_display_value=true"
-            "&sysparm_exclude_reference_link=true"
-            "&sysparm_no_count=true"
-        )
-        result = self._add_default_params(url)
-
-        self.assertEqual(result, url)
-
-    async def test_add_default_params_partial_existing(self):
-        """Test that only missing params are added when some already present."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_display_value=true"
-        result = self._add_default_params(url)
-
-        self.assertEqual(result.count("sysparm_display_value"), 1)
-        self.assertIn("sysparm_exclude_reference_link=true", result)
-        self.assertIn("sysparm_no_count=true", result)
-
-    # --- make_nws_request tests ---
-
-    @patch('http_layer.request_dispatcher.make_oauth_request')
-    async def test_make_nws_request_success(self, mock_oauth_request):
-        """Test successful API request includes all default params."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
-
-        mock_oauth_request.return_value = {
-            'result': [
-                {'number': {'value': 'INC001', 'display_value': 'INC001'}}
-            ]
-        }
+def test_ensure_query_encoded_preserves_sn_operators(http_api):
+    """Test that ServiceNow operators (=, ^, <, >, etc.) are preserved."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_query=priority=1^state=2^ORstate=3"
+    result = http_api._ensure_query_encoded(url)
+    assert result == url
 
-        url = "https://test.service-now.com/api/now/table/incident"
-        result = await self.make_nws_request(url)
-
-        # Verify the request was made with all default params
-        mock_oauth_request.assert_called_once()
-        called_url = mock_oauth_request.call_args[0][0]
-        self.assertIn("sysparm_display_value=true", called_url)
-        self.assertIn("sysparm_exclude_reference_link=true", called_url)
-        self.assertIn("sysparm_no_count=true", called_url)
-
-        # Check result is processed (display values extracted)
-        expected = {
-            'result': [
-                {'number': 'INC001'}
-            ]
-        }
-        self.assertEqual(result, expected)
 
-    @patch('http_layer.request_dispatcher.make_oauth_request')
-    async def test_make_nws_request_encodes_query(self, mock_oauth_request):
-        """Test that make_nws_request encodes sysparm_query before sending."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
+def test_ensure_query_encoded_hash_character(http_api):
+    """Test that # in query is encoded to prevent URL fragment issues."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSissue #123"
+    result = http_api._ensure_query_encoded(url)
+    assert "sysparm_query=short_descriptionCONTAINSissue%20%23123" in result
+    assert "#" not in result.split("sysparm_query=")[1].split("&")[0]
+
+
+def test_ensure_query_encoded_idempotent(http_api):
+    """Test that already-encoded URLs are not double-encoded."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSserver%20down"
+    result = http_api._ensure_query_encoded(url)
+    assert "server%20down" in result
+    assert "%2520" not in result
+
+
+def test_ensure_query_encoded_preserves_other_params(http_api):
+    """Test that other URL parameters are not affected by encoding."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_fields=number&sysparm_query=short_descriptionCONTAINSserver down&sysparm_limit=10"
+    result = http_api._ensure_query_encoded(url)
+    assert "sysparm_fields=number" in result
+    assert "sysparm_query=short_descriptionCONTAINSserver%20down" in result
+    assert "sysparm_limit=10" in result
+
+
+# --- _add_default_params tests ---
+
+def test_add_default_params_no_query_string(http_api):
+    """Test adding params to URL with no existing query string."""
+    url = "https://test.service-now.com/api/now/table/incident"
+    result = http_api._add_default_params(url)
+
+    assert "?" in result
+    assert "sysparm_display_value=true" in result
+    assert "sysparm_exclude_reference_link=true" in result
+    assert "sysparm_no_count=true" in result
+
+
+def test_add_default_params_existing_query_string(http_api):
+    """Test adding params to URL that already has a query string."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_fields=number"
+    result = http_api._add_default_params(url)
+
+    assert "sysparm_fields=number" in result
+    assert "&sysparm_display_value=true" in result
+    assert "sysparm_exclude_reference_link=true" in result
+    assert "sysparm_no_count=true" in result
+    assert result.count("?") == 1
+
+
+def test_add_default_params_display_value_false(http_api):
+    """Test that display_value=False skips sysparm_display_value but adds perf params."""
+    url = "https://test.service-now.com/api/now/table/incident"
+    result = http_api._add_default_params(url, display_value=False)
+
+    assert "sysparm_display_value" not in result
+    assert "sysparm_exclude_reference_link=true" in result
+    assert "sysparm_no_count=true" in result
+
+
+def test_add_default_params_idempotent(http_api):
+    """Test that params are not duplicated when already present."""
+    url = (
+        "https://test.service-now.com/api/now/table/incident"
+        "?sysparm_display_value=true"
+        "&sysparm_exclude_reference_link=true"
+        "&sysparm_no_count=true"
+    )
+    result = http_api._add_default_params(url)
+
+    assert result == url
+
+
+def test_add_default_params_partial_existing(http_api):
+    """Test that only missing params are added when some already present."""
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_display_value=true"
+    result = http_api._add_default_params(url)
+
+    assert result.count("sysparm_display_value") == 1
+    assert "sysparm_exclude_reference_link=true" in result
+    assert "sysparm_no_count=true" in result
+
+
+# --- make_nws_request tests ---
+
+# Read-path params add_default_params must put on every GET.
+_DEFAULT_READ_PARAMS = MappingProxyType({
+    "sysparm_display_value": ["true"],
+    "sysparm_exclude_reference_link": ["true"],
+    "sysparm_no_count": ["true"],
+})
+
+
+def assert_default_read_params(url):
+    """Assert that ``url`` carries each default read param exactly once."""
+    params = parse_qs(urlsplit(url).query)
+    for name, expected in _DEFAULT_READ_PARAMS.items():
+        assert params.get(name) == expected, name
+
+
+@pytest.fixture
+def mock_oauth_request(mocker):
+    """Patched read-path transport; tests set return_value or side_effect."""
+    return mocker.patch('http_layer.request_dispatcher.make_oauth_request', autospec=True)
+
+
+@pytest.fixture
+def mock_oauth_client(mocker):
+    """Patched write-path OAuth client; tests configure make_authenticated_request."""
+    from oauth.client import ServiceNowOAuthClient
+
+    # Autospec turns the async methods into AsyncMocks and rejects typos
+    mock_client = mocker.create_autospec(ServiceNowOAuthClient, instance=True, spec_set=True)
+    mocker.patch('http_layer.request_dispatcher.get_oauth_client', return_value=mock_client)
+    return mock_client
+
+
+async def test_make_nws_request_success(http_api, mock_oauth_request):
+    """Test successful API request includes all default params."""
+    mock_oauth_request.return_value = {
+        'result': [
+            {'number': {'value': 'INC001', 'display_value': 'INC001'}}
+        ]
+    }
+
+    url = "https://test.service-now.com/api/now/table/incident"
+    result = await http_api.make_nws_request(url)
+
+    # Verify the request was made with all default params
+    mock_oauth_request.assert_called_once()
+    assert_default_read_params(mock_oauth_request.call_args.args[0])
+
+    # Check result is processed (display values extracted)
+    expected = {
+        'result': [
+            {'number': 'INC001'}
+        ]
+    }
+    assert result == expected
 
-        mock_oauth_request.return_value = {'result': []}
 
-        url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSserver down"
-        await self.make_nws_request(url)
+async def test_make_nws_request_encodes_query(http_api, mock_oauth_request):
+    """Test that make_nws_request encodes sysparm_query before sending."""
+    mock_oauth_request.return_value = {'result': []}
 
-        called_url = mock_oauth_request.call_args[0][0]
-        self.assertIn("server%20down", called_url)
-        self.assertNotIn("server down", called_url)
+    url = "https://test.service-now.com/api/now/table/incident?sysparm_query=short_descriptionCONTAINSserver down"
+    await http_api.make_nws_request(url)
 
-    @patch('http_layer.request_dispatcher.make_oauth_request')
-    async def test_make_nws_request_http_error(self, mock_oauth_request):
-        """Test API request with error returns None."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
+    called_url = mock_oauth_request.call_args.args[0]
+    assert "server%20down" in called_url
+    assert "server down" not in called_url
 
-        mock_oauth_request.side_effect = Exception("404 Not Found")
 
-        url = "https://test.service-now.com/api/now/table/nonexistent"
-        result = await self.make_nws_request(url)
+async def test_make_nws_request_http_error(http_api, mock_oauth_request):
+    """Test API request with error returns None."""
+    mock_oauth_request.side_effect = Exception("404 Not Found")
 
-        self.assertIsNone(result)
+    url = "https://test.service-now.com/api/now/table/nonexistent"
+    result = await http_api.make_nws_request(url)
 
-    @patch('http_layer.request_dispatcher.get_oauth_client')
-    async def test_make_nws_request_write_delegates_to_oauth_client(self, mock_get_client):
-        """POST/PATCH route through oauth_client with raise_for_status=True."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
+    assert result is None
 
-        from unittest.mock import AsyncMock as _AsyncMock
-        mock_client = MagicMock()
-        mock_client.make_authenticated_request = _AsyncMock(
-            return_value={"result": {"number": "VTB0001234"}}
-        )
-        mock_get_client.return_value = mock_client
 
-        url = "https://test.service-now.com/api/now/table/vtb_task"
-        payload = {"short_description": "Test"}
-        result = await self.make_nws_request(url, method="POST", json_data=payload)
+async def test_make_nws_request_write_delegates_to_oauth_client(http_api, mock_oauth_client):
+    """POST/PATCH route through oauth_client with raise_for_status=True."""
+    mock_oauth_client.make_authenticated_request.return_value = {
+        "result": {"number": "VTB0001234"}
+    }
 
-        self.assertEqual(result, {"result": {"number": "VTB0001234"}})
-        mock_client.make_authenticated_request.assert_called_once_with(
-            "POST", url, raise_for_status=True, json=payload
-        )
+    url = "https://test.service-now.com/api/now/table/vtb_task"
+    payload = {"short_description": "Test"}
+    result = await http_api.make_nws_request(url, method="POST", json_data=payload)
 
-    @patch('http_layer.request_dispatcher.get_oauth_client')
-    async def test_make_nws_request_patch_propagates_status_error(self, mock_get_client):
-        """PATCH bubbling HTTPStatusError reaches the caller intact."""
-        if not self.api_available:
-            self.skipTest(f"ServiceNow API not available: {self.import_error}")
+    assert result == {"result": {"number": "VTB0001234"}}
+    mock_oauth_client.make_authenticated_request.assert_called_once_with(
+        "POST", url, raise_for_status=True, json=payload
+    )
 
-        import httpx
-        from unittest.mock import AsyncMock as _AsyncMock
 
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        error = httpx.HTTPStatusError("404", request=MagicMock(), response=mock_response)
+async def test_make_nws_request_patch_propagates_status_error(http_api, mock_oauth_client):
+    """PATCH bubbling HTTPStatusError reaches the caller intact."""
+    import httpx
 
-        mock_client = MagicMock()
-        mock_client.make_authenticated_request = _AsyncMock(side_effect=error)
-        mock_get_client.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.status_code = 404
+    error = httpx.HTTPStatusError("404", request=MagicMock(), response=mock_response)
+    mock_oauth_client.make_authenticated_request.side_effect = error
 
-        url = "https://test.service-now.com/api/now/table/vtb_task/missing"
-        with self.assertRaises(httpx.HTTPStatusError):
-            await self.make_nws_request(url, method="PATCH", json_data={"state": "3"})
+    url = "https://test.service-now.com/api/now/table/vtb_task/missing"
+    with pytest.raises(httpx.HTTPStatusError):
+        await http_api.make_nws_request(url, method="PATCH", json_data={"state": "3"})
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
@@ -0,0 +1,67 @@
+"""
+Tests for utils.py keyword extraction and its memoisation.
+"""
+
+import pytest
+
+import utils
+from utils import extract_keywords, refine_query
+
+
+@pytest.fixture(autouse=True)
+def _clear_keyword_caches():
+    """Start every test with empty keyword caches."""
+    extract_keywords.cache_clear()
+    refine_query.cache_clear()
+    yield
+
+
+def test_extract_keywords_record_number_first():
+    """Test that a ServiceNow record number wins over content words."""
+    assert extract_keywords("Please look at INC0012345 database outage") == ("inc0012345",)
+
+
+def test_extract_keywords_content_words():
+    """Test that stop words and short words are dropped, order preserved."""
+    assert extract_keywords("the database server is down again") == ("database", "server", "down")
+
+
+def test_extract_keywords_repeat_served_from_cache():
+    """Test that repeating the same arguments reuses the cached keywords."""
+    extract_keywords("database server outage")
+    extract_keywords("database server outage")
+
+    info = extract_keywords.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_extract_keywords_returns_immutable_tuple():
+    """Test that cached results are tuples callers cannot mutate."""
+    keywords = extract_keywords("database server outage")
+
+    assert keywords == ("database", "server", "outage")
+    assert extract_keywords("database server outage") is keywords
+
+
+def test_refine_query_cached():
+    """Test that refine_query memoises its result per input."""
+    assert refine_query("Database Server outage") == ("database server", None)
+    assert refine_query("Database Server outage") == ("database server", None)
+    assert refine_query.cache_info().hits == 1
+
+
+def test_extract_record_numbers_in_text_order():
+    """Test that every record type is found in one pass, in order of appearance."""
+    text = "see ritm0001 then inc0002, kb0003, chg0004 and vtb0005"
+    assert utils._extract_record_numbers(text) == ("ritm0001", "inc0002", "kb0003", "chg0004", "vtb0005")
+
+
+@pytest.mark.parametrize("text, max_keywords, expected", [
+    pytest.param("disk disk full full again", 3, ("disk", "full", "again"), id="dedup_in_order"),
+    pytest.param("alpha bravo charlie delta", 2, ("alpha", "bravo"), id="capped"),
+    pytest.param("alpha bravo", 0, (), id="zero_cap"),
+])
+def test_extract_content_keywords(text, max_keywords, expected):
+    """Test order-preserving dedup and the max_keywords cap."""
+    assert utils._extract_content_keywords(text, max_keywords) == expected
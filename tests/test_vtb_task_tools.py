@@ -4,10 +4,11 @@ Target: 90%+ line coverage, 75%+ branch coverage
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch, MagicMock
 import httpx
 
 # Import functions to test
+import Table_Tools.vtb_task_tools as vtb_task_tools
 from Table_Tools.vtb_task_tools import (
     _write_private_task,
     _unwrap_write_response,
@@ -19,6 +20,14 @@ from Table_Tools.vtb_task_tools import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_sys_id_cache():
+    """Start every test without cached task number -> sys_id lookups."""
+    vtb_task_tools._sys_id_cache.clear()
+    yield
+    vtb_task_tools._sys_id_cache.clear()
+
+
 def _make_http_status_error(status_code: int) -> httpx.HTTPStatusError:
     response = MagicMock()
     response.status_code = status_code
@@ -28,7 +37,6 @@ def _make_http_status_error(status_code: int) -> httpx.HTTPStatusError:
 class TestWritePrivateTask:
     """Test the unified write helper that wraps make_nws_request."""
 
-    @pytest.mark.asyncio
     async def test_write_success_returns_inner_result(self):
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
             mock_request.return_value = {
@@ -49,7 +57,6 @@ class TestWritePrivateTask:
                 json_data={"short_description": "Test task"},
             )
 
-    @pytest.mark.asyncio
     async def test_write_no_result_returns_fallback_string(self):
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
             mock_request.return_value = {}
@@ -63,7 +70,6 @@ class TestWritePrivateTask:
 
             assert "successful but no data returned" in result
 
-    @pytest.mark.asyncio
     async def test_write_none_result_returns_fallback_string(self):
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
             mock_request.return_value = None
@@ -77,77 +83,26 @@ class TestWritePrivateTask:
 
             assert "successful but no data returned" in result
 
-    @pytest.mark.asyncio
-    async def test_write_401_returns_auth_failed(self):
-        with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
-            mock_request.side_effect = _make_http_status_error(401)
-
-            result = await _write_private_task(
-                "POST",
-                "https://test.service-now.com/api/now/table/vtb_task",
-                {"short_description": "Test"},
-                "creation",
-            )
-
-            assert "Authentication failed" in result
-
-    @pytest.mark.asyncio
-    async def test_write_403_returns_access_denied(self):
-        with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
-            mock_request.side_effect = _make_http_status_error(403)
-
-            result = await _write_private_task(
-                "PATCH",
-                "https://test.service-now.com/api/now/table/vtb_task/abc",
-                {"state": "3"},
-                "update",
-            )
-
-            assert "Access denied" in result
-
-    @pytest.mark.asyncio
-    async def test_write_400_returns_invalid_request(self):
-        with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
-            mock_request.side_effect = _make_http_status_error(400)
-
-            result = await _write_private_task(
-                "POST",
-                "https://test.service-now.com/api/now/table/vtb_task",
-                {"short_description": "Test"},
-                "creation",
-            )
-
-            assert "Invalid request" in result
-
-    @pytest.mark.asyncio
-    async def test_write_404_returns_not_found(self):
-        with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
-            mock_request.side_effect = _make_http_status_error(404)
-
-            result = await _write_private_task(
-                "PATCH",
-                "https://test.service-now.com/api/now/table/vtb_task/missing",
-                {"state": "3"},
-                "update",
-            )
-
-            assert "not found" in result
-
-    @pytest.mark.asyncio
-    async def test_write_500_returns_server_error(self):
+    @pytest.mark.parametrize("status_code,method,operation,expected", [
+        pytest.param(401, "POST", "creation", "Authentication failed", id="401"),
+        pytest.param(403, "PATCH", "update", "Access denied", id="403"),
+        pytest.param(400, "POST", "creation", "Invalid request", id="400"),
+        pytest.param(404, "PATCH", "update", "not found", id="404"),
+        pytest.param(500, "POST", "creation", "Server error", id="500"),
+    ])
+    async def test_write_http_error_maps_to_message(self, status_code, method, operation, expected):
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
-            mock_request.side_effect = _make_http_status_error(500)
+            mock_request.side_effect = _make_http_status_error(status_code)
 
             result = await _write_private_task(
-                "POST",
+                method,
                 "https://test.service-now.com/api/now/table/vtb_task",
                 {"short_description": "Test"},
-                "creation",
+                operation,
             )
 
-            assert "server error" in result.lower()
+            assert expected in result
 
-    @pytest.mark.asyncio
     async def test_write_generic_exception_returns_request_failed(self):
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
             mock_request.side_effect = Exception("Network error")
@@ -265,7 +220,6 @@ class TestTaskDataPreparation:
 class TestTaskSysIdRetrieval:
     """Test sys_id retrieval function."""
 
-    @pytest.mark.asyncio
     async def test_get_task_sys_id_success(self):
         """Test successful sys_id retrieval."""
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
@@ -278,7 +232,29 @@ class TestTaskSysIdRetrieval:
             assert sys_id == "abc123def456"
             mock_request.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_get_task_sys_id_cached_after_success(self):
+        """Test that a resolved sys_id is served from the cache on repeat lookups."""
+        with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
+            mock_request.return_value = {
+                "result": [{"sys_id": "abc123def456"}]
+            }
+
+            first = await _get_task_sys_id("VTB0001234")
+            second = await _get_task_sys_id("VTB0001234")
+
+            assert first == second == "abc123def456"
+            mock_request.assert_called_once()
+
+    async def test_get_task_sys_id_not_found_is_not_cached(self):
+        """Test that a missing task is looked up again on the next call."""
+        with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
+            mock_request.return_value = {"result": []}
+
+            await _get_task_sys_id("VTB9999999")
+            await _get_task_sys_id("VTB9999999")
+
+            assert mock_request.call_count == 2
+
     async def test_get_task_sys_id_not_found(self):
         """Test sys_id retrieval when task not found."""
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
@@ -288,7 +264,6 @@ class TestTaskSysIdRetrieval:
 
             assert sys_id is None
 
-    @pytest.mark.asyncio
     async def test_get_task_sys_id_no_data(self):
         """Test sys_id retrieval with no data."""
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
@@ -298,7 +273,6 @@ class TestTaskSysIdRetrieval:
 
             assert sys_id is None
 
-    @pytest.mark.asyncio
     async def test_get_task_sys_id_invalid_response(self):
         """Test sys_id retrieval with invalid response."""
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
@@ -312,7 +286,6 @@ class TestTaskSysIdRetrieval:
 class TestCreatePrivateTask:
     """Test create_private_task function with OAuth authentication."""
 
-    @pytest.mark.asyncio
     async def test_create_private_task_success(self):
         """Test successful private task creation."""
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
@@ -332,7 +305,6 @@ class TestCreatePrivateTask:
             kwargs = mock_request.call_args.kwargs
             assert kwargs["method"] == "POST"
 
-    @pytest.mark.asyncio
     async def test_create_private_task_missing_short_description(self):
         """Test task creation fails without short_description."""
         task_data = {"description": "Missing short description"}
@@ -341,7 +313,6 @@ class TestCreatePrivateTask:
 
         assert "short_description is required" in result
 
-    @pytest.mark.asyncio
     async def test_create_private_task_with_all_fields(self):
         """Test task creation with all optional fields."""
         with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
@@ -366,7 +337,6 @@ class TestCreatePrivateTask:
 class TestUpdatePrivateTask:
     """Test update_private_task function with OAuth authentication."""
 
-    @pytest.mark.asyncio
     async def test_update_private_task_success(self):
         """Test successful private task update."""
         with patch('Table_Tools.vtb_task_tools._get_task_sys_id') as mock_sys_id, \
@@ -387,14 +357,36 @@ class TestUpdatePrivateTask:
             kwargs = mock_request.call_args.kwargs
             assert kwargs["method"] == "PATCH"
 
-    @pytest.mark.asyncio
+    async def test_update_private_task_forgets_cached_description(self):
+        """Test that updating a task drops its cached short_description."""
+        with patch('Table_Tools.vtb_task_tools._get_task_sys_id') as mock_sys_id, \
+             patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request, \
+             patch('Table_Tools.vtb_task_tools.forget_record_description') as mock_forget:
+
+            mock_sys_id.return_value = "abc123def456"
+            mock_request.return_value = {"result": {"number": "VTB0001234"}}
+
+            await update_private_task("VTB0001234", {"short_description": "Renamed"})
+
+            mock_forget.assert_called_once_with("vtb_task", "VTB0001234")
+
+    async def test_update_private_task_404_evicts_cached_sys_id(self):
+        """Test that a 404 on PATCH drops the stale cached sys_id."""
+        vtb_task_tools._sys_id_cache["VTB0001234"] = "abc123def456"
+        with patch('Table_Tools.vtb_task_tools.make_nws_request') as mock_request:
+            mock_request.side_effect = _make_http_status_error(404)
+
+            result = await update_private_task("VTB0001234", {"state": "3"})
+
+            assert "not found" in result
+            assert "VTB0001234" not in vtb_task_tools._sys_id_cache
+
     async def test_update_private_task_no_update_data(self):
         """Test update fails without update data."""
         result = await update_private_task("VTB0001234", {})
 
         assert "No update data provided" in result
 
-    @pytest.mark.asyncio
     async def test_update_private_task_not_found(self):
         """Test update fails when task not found."""
         with patch('Table_Tools.vtb_task_tools._get_task_sys_id') as mock_sys_id:
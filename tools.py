@@ -18,10 +18,14 @@ structlog.configure(
     logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
 )
 
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 from audit_middleware import AuditMiddleware
+from oauth.singleton import close_oauth_client
 from Table_Tools.generic_tool_wrappers import (
-    search_records, get_record_summary, get_record, find_similar, filter_records
+    search_records, search_across_tables, get_record_summary, get_record, find_similar,
+    filter_records
 )
 from Table_Tools.consolidated_tools import (
     # Priority incidents (unique date logic)
@@ -78,16 +82,27 @@ _mcp_get_priority_incidents.__name__ = "get_priority_incidents"
 _mcp_get_priority_incidents.__doc__ = get_priority_incidents.__doc__
 
 
-mcp = FastMCP("personalmcpservicenow")
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Release the pooled ServiceNow connections when the server stops."""
+    try:
+        yield
+    finally:
+        await close_oauth_client()
+
+
+mcp = FastMCP("personalmcpservicenow", lifespan=_lifespan)
 mcp.add_middleware(AuditMiddleware())
 
 # Register tools — consolidated from 55 -> 37 (v3.0) -> 32 (v4.0) -> 38 (v4.1 KB expansion)
-tools = [
+# -> 39 (cross-table text search)
+tools = (
     # Server & Authentication tools
     nowtest, now_test_oauth, now_auth_info, nowtestauth, nowtest_auth_input,
 
     # Generic table tools (replace 24 table-specific wrappers)
-    search_records, get_record_summary, get_record, find_similar, filter_records,
+    search_records, search_across_tables, get_record_summary, get_record, find_similar,
+    filter_records,
 
     # Priority incidents (unique date logic) — wrapper strips **deprecated_kwargs for fastmcp v3
     _mcp_get_priority_incidents,
@@ -113,7 +128,7 @@ tools = [
     # Intelligent query tools
     intelligent_search, explain_servicenow_filters, build_smart_servicenow_filter,
     get_servicenow_filter_templates, get_query_examples
-]
+)
 
 for tool in tools:
     mcp.tool()(tool)
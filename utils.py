@@ -1,35 +1,39 @@
-from typing import List, Optional
+import functools
+from typing import List, Optional, Tuple
 import re
 
-# Compiled regex patterns for performance
-_SERVICENOW_RECORD_PATTERNS = [
-    re.compile(r'\bchg\d+\b', re.IGNORECASE),
-    re.compile(r'\binc\d+\b', re.IGNORECASE), 
-    re.compile(r'\bkb\d+\b', re.IGNORECASE),
-    re.compile(r'\britm\d+\b', re.IGNORECASE),
-    re.compile(r'\bvtb\d+\b', re.IGNORECASE)
-]
+# Single compiled alternation so record numbers are found in one pass
+_SERVICENOW_RECORD_RE = re.compile(r'\b(?:chg|inc|kb|ritm|vtb)\d+\b', re.IGNORECASE)
 
 # Common stop words to filter out
-_STOP_WORDS = {
+_STOP_WORDS = frozenset({
     'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 
     'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
     'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-}
+})
 
-def extract_keywords(input_text: str, context: str = "general", max_keywords: int = 3) -> List[str]:
+# Content words: 4+ letters. Callers pass already-lowered text.
+_CONTENT_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Keyword extraction is pure, and prompts repeat across tool calls.
+_KEYWORD_CACHE_SIZE = 2048
+
+@functools.lru_cache(maxsize=_KEYWORD_CACHE_SIZE)
+def extract_keywords(input_text: str, context: str = "general", max_keywords: int = 3) -> Tuple[str, ...]:
     """Extract relevant keywords from input text using lightweight regex patterns.
     
+    Results are memoised; they are tuples, so callers cannot mutate a cached entry.
+    
     Args:
         input_text: The raw input text to process.
         context: The context for keyword extraction (unused in simplified version).
         max_keywords: Maximum number of keywords to return.
     
     Returns:
-        A list of top keywords limited by max_keywords.
+        A tuple of top keywords limited by max_keywords.
     """
     if not input_text or not input_text.strip():
-        return []
+        return ()
     
     input_text = input_text.strip().lower()
     
@@ -39,33 +43,31 @@ def extract_keywords(input_text: str, context: str = "general", max_keywords: in
         return record_matches[:1]  # Return only first match
     
     # Extract content keywords using simplified approach
-    content_keywords = _extract_content_keywords(input_text, max_keywords)
-    return content_keywords
+    return _extract_content_keywords(input_text, max_keywords)
 
-def _extract_record_numbers(text: str) -> List[str]:
-    """Extract ServiceNow record numbers from text."""
-    matches = []
-    for pattern in _SERVICENOW_RECORD_PATTERNS:
-        found = pattern.findall(text)
-        if found:
-            matches.extend(found)
-    return matches
+def _extract_record_numbers(text: str) -> Tuple[str, ...]:
+    """Extract ServiceNow record numbers from text, in order of appearance."""
+    return tuple(_SERVICENOW_RECORD_RE.findall(text))
 
-def _extract_content_keywords(text: str, max_keywords: int) -> List[str]:
-    """Extract content keywords using basic text processing."""
-    # Split into words and filter
-    words = re.findall(r'\b[a-zA-Z]{4,}\b', text)  # Words 4+ chars, letters only
-    
-    # Filter out stop words and convert to lowercase
-    keywords = [
-        word.lower() for word in words 
-        if word.lower() not in _STOP_WORDS
-    ]
-    
-    # Remove duplicates while preserving order
-    unique_keywords = list(dict.fromkeys(keywords))
-    return unique_keywords[:max_keywords]
+def _extract_content_keywords(text: str, max_keywords: int) -> Tuple[str, ...]:
+    """Extract content keywords from lowercase text using basic text processing."""
+    if max_keywords <= 0:
+        return ()
+
+    # Scan lazily, skipping stop words and repeats, and stop at the cap
+    keywords: List[str] = []
+    seen = set()
+    for match in _CONTENT_WORD_RE.finditer(text):
+        word = match.group()
+        if word in _STOP_WORDS or word in seen:
+            continue
+        seen.add(word)
+        keywords.append(word)
+        if len(keywords) >= max_keywords:
+            break
+    return tuple(keywords)
 
+@functools.lru_cache(maxsize=_KEYWORD_CACHE_SIZE)
 def refine_query(input_text: str) -> tuple[str, Optional[str]]:
     """Refine input text for search queries."""
     input_text = " ".join(input_text.strip().lower().split())